@@ -0,0 +1,9 @@
+"""Compiled Markdown heading patterns used by the chunking modules."""
+
+from __future__ import annotations
+
+import re
+
+# A heading line together with its title. Indentation before the marks is
+# tolerated and the title must contain at least one non-space character.
+HEADING_TITLE_RE = re.compile(r"^[^\S\n]*#{1,6}[^\S\n]+(.*\S)", re.MULTILINE)
@@ -4,45 +4,78 @@ from __future__ import annotations
 
 import json
 import logging
-import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-import requests
-from requests import RequestException, Response
+from typing import Any, Dict, List, Optional, Tuple
 
 from embedders import EmbeddingClient, EmbeddingClientError
 
+from chunkers._patterns import HEADING_TITLE_RE
 from chunkers.recursive_splitter import RecursiveTextSplitter
 from chunkers.semantic_splitter import SemanticSplitter
+from chunkers.title_cache import TitleCache, simhash64, title_cache_key
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the standard library
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
-_HEADING_REGEX = re.compile(r"^(?P<hashes>#{1,6})\s+(?P<title>.+)$", re.MULTILINE)
+# Default for ``Chunker.section_client``: the client is built on the first
+# title request. Passing ``section_client=None`` disables LLM titles instead.
+_DEFAULT_SECTION_CLIENT: Any = object()
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse the JSON config at ``path``; ``mtime_ns`` invalidates stale entries."""
+
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def _first_heading(block: str) -> Optional[str]:
+    """Return the title of the first heading in ``block`` or ``None``."""
+
+    if "#" not in block:
+        return None
+    match = HEADING_TITLE_RE.search(block)
+    return match.group(1).strip() if match else None
+
 
+def _inline_heading_title(segment: str) -> Optional[str]:
+    """Return the title of the first complete heading line inside ``segment``.
 
-def _extract_section_heading(block: str) -> Optional[str]:
-    """Return the first Markdown heading text found in ``block``."""
+    A heading on the segment's last line may have been cut by the recursive
+    splitter, so it is ignored.
+    """
 
-    for line in block.splitlines():
-        match = _HEADING_REGEX.match(line.strip())
-        if match:
-            return match.group("title").strip()
+    if "#" not in segment:
+        return None
+    for match in HEADING_TITLE_RE.finditer(segment):
+        if segment.find("\n", match.end()) >= 0:
+            return match.group(1).strip()
     return None
 
 
-def _strip_heading_from_block(block: str) -> str:
-    """Remove the first heading line from ``block`` while keeping the rest."""
+def _split_section_heading(block: str) -> Tuple[Optional[str], str]:
+    """Return the first heading of ``block`` and the block content.
 
-    lines = block.splitlines()
-    if not lines:
-        return block
+    The content has the heading line removed when the block starts with it,
+    otherwise ``block`` is returned unchanged. Both values come from a single
+    regex scan over the block.
+    """
 
-    first_line = lines[0].strip()
-    if _HEADING_REGEX.match(first_line):
-        return "\n".join(lines[1:]).lstrip()
-    return block
+    match = HEADING_TITLE_RE.search(block) if "#" in block else None
+    if match is None:
+        return None, block
+    title = match.group(1).strip()
+    if "\n" in block[: match.start()]:
+        return title, block
+    return title, block[match.end() :].lstrip()
 
 
 @dataclass
@@ -58,7 +91,8 @@ class Chunker:
     _llm_available: bool = field(default=True, init=False)
     llm_log_dir: Optional[Path] = field(default=None, init=False)
     _request_counter: int = field(default=0, init=False)
-    section_client: Optional[EmbeddingClient] = field(default_factory=EmbeddingClient)
+    section_client: Optional[EmbeddingClient] = field(default=_DEFAULT_SECTION_CLIENT, repr=False)
+    title_cache: TitleCache = field(default_factory=TitleCache)
 
     def __post_init__(self) -> None:
         self.recursive_splitter = RecursiveTextSplitter(
@@ -77,54 +111,68 @@ class Chunker:
         if not document_content:
             return []
 
-        semantic_blocks = self.semantic_splitter.split(document_content)
+        if len(document_content) <= self.chunk_size and "#" not in document_content:
+            # A short document without headings is a single block; skip the splitter.
+            semantic_blocks = [document_content] if document_content.strip() else []
+        else:
+            semantic_blocks = self.semantic_splitter.split(document_content)
         if not semantic_blocks:
             return []
 
-        chunks: List[Dict[str, Any]] = []
-        chunk_index = 0
         title = str(metadata_base.get("title", "") or "")
 
+        # First pass: split every block and remember where each segment came from.
+        segments: List[Tuple[str, str, int]] = []
         for semantic_block in semantic_blocks:
-            heading = _extract_section_heading(semantic_block)
+            if len(semantic_block) <= self.chunk_size:
+                # Small blocks are emitted whole; only the heading is needed.
+                segments.append((semantic_block.strip(), _first_heading(semantic_block) or "", 0))
+                continue
+            heading, block_content = _split_section_heading(semantic_block)
             base_section = heading or ""
-            block_content = (
-                _strip_heading_from_block(semantic_block)
-                if heading
-                else semantic_block
-            )
             block_segments = self._split_if_oversized(
                 original=semantic_block,
                 content=block_content,
                 heading=heading,
             )
-
             for segment_index, segment in enumerate(block_segments):
-                section = ""
-                if segment_index == 0 and base_section:
-                    section = base_section
-                else:
-                    section = self._generate_section_title(segment)
-                    if not section:
-                        section = self._fallback_section_title(
-                            segment,
-                            base_section=base_section,
-                            segment_index=segment_index,
-                        )
-                metadata = {
-                    "title": title,
-                    "section": section,
-                    "chunk_index": chunk_index,
-                }
-
-                chunk_data = {
-                    "document_id": document_id,
-                    "chunk_id": f"{document_id}-{chunk_index}",
-                    "content": segment.strip(),
-                    "metadata": metadata,
-                }
-                chunks.append(chunk_data)
-                chunk_index += 1
+                segments.append((segment, base_section, segment_index))
+
+        # Segments without a heading of their own get titles from one batched LLM call.
+        sections = [
+            base_section
+            if segment_index == 0 and base_section
+            else _inline_heading_title(segment) or ""
+            for segment, base_section, segment_index in segments
+        ]
+        pending = [index for index, section in enumerate(sections) if not section]
+        titles = self._generate_section_titles([segments[index][0] for index in pending])
+        for index, generated in zip(pending, titles):
+            sections[index] = generated
+
+        chunk_id_prefix = f"{document_id}-"
+        chunks: List[Dict[str, Any]] = []
+        for chunk_index, (segment_data, section) in enumerate(zip(segments, sections)):
+            segment, base_section, segment_index = segment_data
+            if not section:
+                section = self._fallback_section_title(
+                    segment,
+                    base_section=base_section,
+                    segment_index=segment_index,
+                )
+            metadata = {
+                "title": title,
+                "section": section,
+                "chunk_index": chunk_index,
+            }
+
+            chunk_data = {
+                "document_id": document_id,
+                "chunk_id": chunk_id_prefix + str(chunk_index),
+                "content": segment,
+                "metadata": metadata,
+            }
+            chunks.append(chunk_data)
 
         return chunks
 
@@ -134,18 +182,17 @@ class Chunker:
         content: str,
         heading: Optional[str],
     ) -> List[str]:
-        """Split ``content`` if it exceeds ``chunk_size``."""
+        """Split ``content`` if it exceeds ``chunk_size``.
+
+        Every returned segment is already stripped of surrounding whitespace.
+        """
 
         if len(original) <= self.chunk_size:
             return [original.strip()]
 
         # For large sections keep heading in first segment.
-        segments = self.recursive_splitter.split(content)
-        if not segments:
-            return [original.strip()]
-
         formatted_segments: List[str] = []
-        for index, segment in enumerate(segments):
+        for index, segment in enumerate(self.recursive_splitter.split_iter(content)):
             segment_text = segment.strip()
             if not segment_text:
                 continue
@@ -154,24 +201,67 @@ class Chunker:
             formatted_segments.append(segment_text)
         return formatted_segments or [original.strip()]
 
-    def _generate_section_title(self, chunk_content: str) -> str:
-        """Generate a short section title using the configured LLM."""
+    def _generate_section_titles(self, contents: List[str]) -> List[str]:
+        """Generate short section titles for ``contents`` with a single LLM batch.
 
-        if self.section_client is None:
-            return ""
+        Titles already present in ``title_cache`` are reused, either for the
+        exact content or for a near-duplicate when the cache enables it, and
+        only the remaining distinct contents are sent to the LLM. Entries that
+        could not be generated are returned as empty strings so callers can
+        fall back to deterministic titles.
+        """
+
+        if not contents or not self._llm_available:
+            return []
+        client = self._get_section_client()
+        if client is None:
+            return []
+
+        model = client.section_model
+        keys = [title_cache_key(model, content) for content in contents]
+        titles = [self.title_cache.get(key) or "" for key in keys]
+        missing = [index for index, cached in enumerate(titles) if not cached]
+        fingerprints: Dict[int, int] = {}
+        if missing and self.title_cache.near_duplicate_distance is not None:
+            for index in missing:
+                fingerprints[index] = simhash64(contents[index])
+                titles[index] = self.title_cache.get_similar(fingerprints[index]) or ""
+            missing = [index for index in missing if not titles[index]]
+        if not missing:
+            return titles
 
         if self.llm_log_dir is not None:
-            self.section_client.log_dir = self.llm_log_dir
+            client.log_dir = self.llm_log_dir
 
+        # Identical contents share one request; the title is fanned out below.
+        first_by_key: Dict[str, int] = {}
+        for index in missing:
+            first_by_key.setdefault(keys[index], index)
+        unique = list(first_by_key.values())
         try:
-            titles = self.section_client.generate_section_titles([chunk_content])
+            generated = client.generate_section_titles(
+                [contents[index] for index in unique]
+            )
         except EmbeddingClientError as exc:
             logger.warning("LLM section title generation failed: %s", exc)
-            return ""
+            return titles
 
-        if not titles:
-            return ""
-        return titles[0].strip()
+        generated_by_key: Dict[str, str] = {}
+        for index, value in zip(unique, generated):
+            value = value.strip()
+            generated_by_key[keys[index]] = value
+            if value:
+                self.title_cache.set(keys[index], value, fingerprints.get(index))
+        for index in missing:
+            titles[index] = generated_by_key.get(keys[index], "")
+        return titles
+
+    def _get_section_client(self) -> Optional[EmbeddingClient]:
+        """Return the section client, building the default one on first use."""
+
+        if self.section_client is _DEFAULT_SECTION_CLIENT:
+            self.section_client = EmbeddingClient()
+        return self.section_client
 
     def _fallback_section_title(
         self,
@@ -189,7 +279,7 @@ class Chunker:
         if not cleaned and base_section:
             return base_section
 
-        first_line = cleaned.splitlines()[0] if cleaned else ""
+        first_line = cleaned.partition("\n")[0]
         fallback = first_line.lstrip("# ").strip()
         if not fallback:
             fallback = base_section
@@ -198,98 +288,19 @@ class Chunker:
             return fallback[:10]
         return ""
 
-    def _extract_content_from_response(
-        self,
-        response: Response,
-        log_prefix: Optional[str],
-        chunk_preview: str,
-    ) -> str:
-        """Parse title text from LLM response."""
-
-        try:
-            data = response.json()
-        except (ValueError, json.JSONDecodeError) as exc:
-            logger.warning("Invalid LLM response format: %s", exc)
-            if log_prefix and self.llm_log_dir is not None:
-                error_log = self.llm_log_dir / f"{log_prefix}_response_error.json"
-                error_log.write_text(
-                    json.dumps(
-                        {
-                            "chunk_preview": chunk_preview,
-                            "error": str(exc),
-                        },
-                        ensure_ascii=False,
-                        indent=2,
-                    ),
-                    encoding="utf-8",
-                )
-            self._llm_available = False
-            return ""
-
-        try:
-            choices = data["choices"]
-            if not choices:
-                if log_prefix and self.llm_log_dir is not None:
-                    empty_log = self.llm_log_dir / f"{log_prefix}_response_empty.json"
-                    empty_log.write_text(
-                        json.dumps(
-                            {
-                                "chunk_preview": chunk_preview,
-                                "response": data,
-                            },
-                            ensure_ascii=False,
-                            indent=2,
-                        ),
-                        encoding="utf-8",
-                    )
-                return ""
-            message = choices[0]["message"]
-            content = message.get("content", "")
-            if not isinstance(content, str):
-                return ""
-            extracted = content.strip()
-            if log_prefix and self.llm_log_dir is not None:
-                response_log = self.llm_log_dir / f"{log_prefix}_response.json"
-                response_log.write_text(
-                    json.dumps(
-                        {
-                            "chunk_preview": chunk_preview,
-                            "response": data,
-                            "extracted_title": extracted,
-                        },
-                        ensure_ascii=False,
-                        indent=2,
-                    ),
-                    encoding="utf-8",
-                )
-            return extracted
-        except (KeyError, TypeError):
-            logger.warning("Missing expected fields in LLM response.")
-            if log_prefix and self.llm_log_dir is not None:
-                error_log = self.llm_log_dir / f"{log_prefix}_response_error.json"
-                error_log.write_text(
-                    json.dumps(
-                        {
-                            "chunk_preview": chunk_preview,
-                            "error": "Missing expected fields in response.",
-                        },
-                        ensure_ascii=False,
-                        indent=2,
-                    ),
-                    encoding="utf-8",
-                )
-            self._llm_available = False
-            return ""
-
     def _load_api_config(self) -> Optional[Dict[str, Any]]:
-        """Load the API configuration from ``config_path``."""
+        """Load the API configuration from ``config_path``.
+
+        Parsed configs are shared across instances and reloaded only when the
+        file modification time changes.
+        """
 
         if self._api_config_cache is not None:
             return self._api_config_cache
 
         try:
-            raw = self.config_path.read_text(encoding="utf-8")
-            config = json.loads(raw)
+            mtime_ns = self.config_path.stat().st_mtime_ns
+            config = _load_config_cached(str(self.config_path), mtime_ns)
         except FileNotFoundError:
             logger.warning("LLM config file not found: %s", self.config_path)
             self._api_config_cache = None
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import Iterator, List
 
 
 @dataclass
@@ -42,18 +42,26 @@ class RecursiveTextSplitter:
 
         if not text:
             return []
+        size = self.chunk_size
+        return [text[start : start + size] for start in self._starts(len(text))]
+
+    def split_iter(self, text: str | None) -> Iterator[str]:
+        """Yield the chunks of :meth:`split` one at a time."""
+
+        if not text:
+            return
+        size = self.chunk_size
+        for start in self._starts(len(text)):
+            yield text[start : start + size]
+
+    def _starts(self, length: int) -> range:
+        """Return the chunk start offsets for a text of ``length`` characters.
+
+        Chunks advance by ``chunk_size - overlap`` and the last one is the
+        first whose end reaches ``length``.
+        """
 
-        length = len(text)
         if length <= self.chunk_size:
-            return [text]
-
-        chunks: List[str] = []
-        start = 0
-        while start < length:
-            end = start + self.chunk_size
-            chunk = text[start:end]
-            chunks.append(chunk)
-            if end >= length:
-                break
-            start = end - self.overlap
-        return chunks
+            return range(1)
+        step = self.chunk_size - self.overlap
+        return range(0, length - self.chunk_size + step, step)
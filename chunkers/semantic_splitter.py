@@ -2,12 +2,41 @@
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 from typing import List
 
 
-_HEADING_PATTERN = re.compile(r"^(?P<hashes>#{1,6})\s+.*$", re.MULTILINE)
+def _heading_starts(text: str, min_level: int = 1, max_level: int = 6) -> List[int]:
+    """Return the offsets of Markdown headings in ``text`` within a level range.
+
+    A heading is a line opening with one to six ``#`` followed by
+    whitespace. The whitespace run after the marks is consumed greedily,
+    so a line it reaches by crossing newlines is not itself a heading.
+    Headings outside ``min_level``..``max_level`` are skipped the same way
+    but not reported.
+    """
+
+    starts: List[int] = []
+    length = len(text)
+    find = text.find
+    startswith = text.startswith
+    pos = 0
+    while True:
+        if startswith("#", pos):
+            level = 1
+            while level < 6 and startswith("#", pos + level):
+                level += 1
+            end = pos + level
+            if end < length and text[end].isspace():
+                if min_level <= level <= max_level:
+                    starts.append(pos)
+                while end < length and text[end].isspace():
+                    end += 1
+                pos = end
+        newline = find("\n", pos)
+        if newline < 0:
+            return starts
+        pos = newline + 1
 
 
 @dataclass
@@ -38,19 +67,13 @@ class SemanticSplitter:
         if text.strip() == "":
             return []
 
-        matches = [
-            match
-            for match in _HEADING_PATTERN.finditer(text)
-            if self.min_heading_level <= len(match.group("hashes")) <= self.max_heading_level
-        ]
-
-        if not matches:
+        offsets = _heading_starts(text, self.min_heading_level, self.max_heading_level)
+        if not offsets:
             return [text]
 
+        offsets.append(len(text))
         chunks: List[str] = []
-        for index, match in enumerate(matches):
-            start = match.start()
-            end = matches[index + 1].start() if index + 1 < len(matches) else len(text)
+        for start, end in zip(offsets, offsets[1:]):
             chunk = text[start:end].strip()
             if chunk:
                 chunks.append(chunk)
@@ -0,0 +1,128 @@
+"""In-memory cache for LLM generated section titles."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the standard library
+    orjson = None
+
+_SHINGLE_SIZE = 3
+
+
+def title_cache_key(model: str, content: str) -> str:
+    """Return a stable cache key for ``content`` titled by ``model``."""
+
+    request = {"model": model, "prompt": content}
+    if orjson is not None:
+        payload = orjson.dumps(request, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(
+            request, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+        ).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def simhash64(text: str) -> int:
+    """Return a 64-bit SimHash fingerprint of ``text``.
+
+    Features are character 3-grams weighted by frequency, so texts that
+    differ in a few characters map to fingerprints a few bits apart.
+    """
+
+    if len(text) <= _SHINGLE_SIZE:
+        shingles = Counter([text])
+    else:
+        shingles = Counter(text[i : i + _SHINGLE_SIZE] for i in range(len(text) - _SHINGLE_SIZE + 1))
+
+    weights = [0] * 64
+    for shingle, count in shingles.items():
+        digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "big")
+        for bit in range(64):
+            if value >> bit & 1:
+                weights[bit] += count
+            else:
+                weights[bit] -= count
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+@dataclass
+class TitleCache:
+    """Bounded LRU cache mapping chunk content to generated section titles.
+
+    Parameters
+    ----------
+    max_entries:
+        Maximum number of titles kept before the least recently used entry
+        is evicted. Must be a positive integer.
+    near_duplicate_distance:
+        When set, titles stored with a SimHash fingerprint are also reused
+        for contents whose fingerprint is at most this many bits away.
+        ``None`` disables near-duplicate lookups.
+    """
+
+    max_entries: int = 4096
+    near_duplicate_distance: Optional[int] = None
+    _entries: "OrderedDict[str, str]" = field(
+        default_factory=OrderedDict,
+        init=False,
+        repr=False,
+    )
+    _fingerprints: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if self.near_duplicate_distance is not None and not 0 <= self.near_duplicate_distance <= 64:
+            raise ValueError("near_duplicate_distance must be between 0 and 64")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached title for ``key`` or ``None`` on a miss."""
+
+        title = self._entries.get(key)
+        if title is not None:
+            self._entries.move_to_end(key)
+        return title
+
+    def get_similar(self, fingerprint: int) -> Optional[str]:
+        """Return a title stored for a near-duplicate of ``fingerprint``."""
+
+        if self.near_duplicate_distance is None:
+            return None
+        best_key: Optional[str] = None
+        best_distance = self.near_duplicate_distance + 1
+        for key, stored in self._fingerprints.items():
+            distance = (stored ^ fingerprint).bit_count()
+            if distance < best_distance:
+                best_key, best_distance = key, distance
+                if distance == 0:
+                    break
+        if best_key is None:
+            return None
+        return self.get(best_key)
+
+    def set(self, key: str, title: str, fingerprint: Optional[int] = None) -> None:
+        """Store ``title`` under ``key`` evicting the oldest entry when full."""
+
+        self._entries[key] = title
+        self._entries.move_to_end(key)
+        if fingerprint is not None and self.near_duplicate_distance is not None:
+            self._fingerprints[key] = fingerprint
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._fingerprints.pop(evicted, None)
@@ -1,9 +1,24 @@
-"""Cleaner package exposing available cleaner classes."""
+"""Cleaner package exposing available cleaner classes.
+
+Cleaner modules are imported on first attribute access so a caller that
+needs one cleaner does not pay for the others' parser imports (pdfplumber,
+BeautifulSoup).
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, Tuple
 
 from .base import BaseCleaner
-from .html import HtmlCleaner
-from .pdf import PdfCleaner
-from .placeholders import MarkdownCleaner
+
+if TYPE_CHECKING:  # pragma: no cover - static imports for type checkers only
+    from .html import HtmlCleaner
+    from .pdf import PdfCleaner
+    from .placeholders import MarkdownCleaner
+
+    HTMLCleaner = HtmlCleaner
+    PDFCleaner = PdfCleaner
 
 __all__ = [
     "BaseCleaner",
@@ -14,5 +29,24 @@ __all__ = [
     "PDFCleaner",
 ]
 
-HTMLCleaner = HtmlCleaner
-PDFCleaner = PdfCleaner
+_LAZY_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "HtmlCleaner": (".html", "HtmlCleaner"),
+    "HTMLCleaner": (".html", "HtmlCleaner"),
+    "PdfCleaner": (".pdf", "PdfCleaner"),
+    "PDFCleaner": (".pdf", "PdfCleaner"),
+    "MarkdownCleaner": (".placeholders", "MarkdownCleaner"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
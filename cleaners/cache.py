@@ -0,0 +1,50 @@
+"""Content-addressed cache for cleaned document text."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Type
+
+from .base import BaseCleaner
+
+
+@lru_cache(maxsize=1)
+def _cleaners_source_digest() -> bytes:
+    """Return a digest of the :mod:`cleaners` package source files."""
+
+    digest = hashlib.blake2b(digest_size=20)
+    for source in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(source.name.encode("utf-8"))
+        digest.update(source.read_bytes())
+    return digest.digest()
+
+
+def clean_cache_path(input_path: Path, cleaner_cls: Type[BaseCleaner], cache_dir: Path) -> Path:
+    """Return the entry in ``cache_dir`` for the cleaned text of ``input_path``.
+
+    The key covers the raw file bytes, the cleaner class and the cleaners'
+    source code, so changing the document or the cleaning code invalidates
+    cached results.
+    """
+
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(_cleaners_source_digest())
+    digest.update(cleaner_cls.__qualname__.encode("utf-8"))
+    digest.update(input_path.read_bytes())
+    return cache_dir / f"{digest.hexdigest()}.txt"
+
+
+def write_clean_cache(cache_path: Path, cleaned: bytes) -> None:
+    """Store ``cleaned`` at ``cache_path`` without exposing a partial entry.
+
+    The bytes are written to a per-process temporary file and renamed into
+    place, so concurrent workers never read a half-written entry.
+    """
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    partial_path.write_bytes(cleaned)
+    partial_path.replace(cache_path)
@@ -5,9 +5,10 @@ from __future__ import annotations
 import logging
 import re
 import unicodedata
+from functools import lru_cache
 from html.parser import HTMLParser
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Set, Union
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple, Union
 
 try:  # pragma: no cover - bs4 is optional at runtime
     from bs4 import BeautifulSoup, Comment, NavigableString, Tag
@@ -24,6 +25,37 @@ from .base import BaseCleaner
 
 LOGGER = logging.getLogger(__name__)
 
+_HORIZONTAL_SPACE_RE = re.compile(r"[ \t\f\v]+")
+_NEWLINE_PADDING_RE = re.compile(r" ?\n ?")
+_EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _resolve_parser_name() -> str:
+    """Return the fastest BeautifulSoup tree builder available.
+
+    ``lxml`` tokenizes in C and is preferred when installed; otherwise the
+    pure Python ``html.parser`` is used.
+    """
+
+    if BeautifulSoup is None:
+        return "html.parser"
+    try:
+        BeautifulSoup("", "lxml")
+    except Exception:  # noqa: BLE001 - bs4 raises FeatureNotFound when lxml is missing
+        return "html.parser"
+    return "lxml"
+
+
+_PARSER_NAME = _resolve_parser_name()
+
+
+@lru_cache(maxsize=64)
+def _lowered_names(names: FrozenSet[str]) -> FrozenSet[str]:
+    """Return ``names`` lower-cased, memoised for the class-level tag sets."""
+
+    return frozenset(name.lower() for name in names)
+
 
 class SimpleNode:
     """Lightweight fallback representation for HTML nodes."""
@@ -36,7 +68,8 @@ class SimpleNode:
         attrs: Optional[Dict[str, str]] = None,
         parent: Optional["SimpleNode"] = None,
     ) -> None:
-        self.name = name
+        # Tag names are case-insensitive; lower them once instead of per lookup.
+        self.name = name.lower()
         self.attrs = attrs or {}
         self.children: List[Union["SimpleNode", str]] = []
         self.parent = parent
@@ -49,20 +82,24 @@ class SimpleNode:
         names: Optional[Union[Set[str], Sequence[str]]] = None,
         recursive: bool = True,
     ) -> List["SimpleNode"]:
-        if names is None:
-            name_set: Optional[Set[str]] = None
-        elif isinstance(names, (set, frozenset)):
-            name_set = {name.lower() for name in names}
-        else:
-            name_set = {name.lower() for name in names}
+        name_set = None if names is None else _lowered_names(frozenset(names))
 
         matches: List["SimpleNode"] = []
-        for child in self.children:
-            if isinstance(child, SimpleNode):
-                if name_set is None or child.name.lower() in name_set:
+        if not recursive:
+            for child in self.children:
+                if isinstance(child, SimpleNode) and (name_set is None or child.name in name_set):
                     matches.append(child)
-                if recursive:
-                    matches.extend(child.find_all(name_set, recursive=True))
+            return matches
+
+        # Explicit stack instead of recursion: no frame per node and no
+        # recursion limit on deeply nested markup. Children are pushed in
+        # reverse so nodes pop in document (pre-)order.
+        stack = [child for child in reversed(self.children) if isinstance(child, SimpleNode)]
+        while stack:
+            node = stack.pop()
+            if name_set is None or node.name in name_set:
+                matches.append(node)
+            stack.extend(child for child in reversed(node.children) if isinstance(child, SimpleNode))
         return matches
 
     def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
@@ -71,12 +108,29 @@ class SimpleNode:
     def decompose(self) -> None:
         if self.parent is None:
             return
-        self.parent.children = [
-            child for child in self.parent.children if child is not self
-        ]
+        siblings = self.parent.children
+        for index, child in enumerate(siblings):
+            if child is self:
+                del siblings[index]
+                break
         self.parent = None
         self.children = []
 
+    @staticmethod
+    def decompose_all(nodes: Sequence["SimpleNode"]) -> None:
+        """Detach ``nodes`` rebuilding each affected parent's children once."""
+
+        doomed_by_parent: Dict[int, tuple["SimpleNode", Set[int]]] = {}
+        for node in nodes:
+            if node.parent is not None:
+                _, doomed = doomed_by_parent.setdefault(id(node.parent), (node.parent, set()))
+                doomed.add(id(node))
+        for parent, doomed in doomed_by_parent.values():
+            parent.children = [child for child in parent.children if id(child) not in doomed]
+        for node in nodes:
+            node.parent = None
+            node.children = []
+
 
 class SimpleDocument(SimpleNode):
     """Root node containing reference to the <body> element when available."""
@@ -112,22 +166,30 @@ class _MiniHTMLParser(HTMLParser):
         super().__init__()
         self.document = SimpleDocument()
         self._stack: List[SimpleNode] = [self.document]
+        # Stack positions of the currently open elements, per tag name, so
+        # an end tag finds its element without scanning the stack.
+        self._open_positions: Dict[str, List[int]] = {}
 
     def handle_starttag(self, tag: str, attrs: Sequence[tuple[str, Optional[str]]]) -> None:
         attr_dict = {name: value or "" for name, value in attrs}
         node = SimpleNode(tag, attr_dict, parent=self._stack[-1])
         self._stack[-1].append_child(node)
-        if tag.lower() == "body":
+        # HTMLParser already reports tag names in lower case.
+        if tag == "body":
             self.document.body = node
-        if tag.lower() not in self.VOID_ELEMENTS:
+        if tag not in self.VOID_ELEMENTS:
+            self._open_positions.setdefault(node.name, []).append(len(self._stack))
             self._stack.append(node)
 
     def handle_endtag(self, tag: str) -> None:
-        tag_lower = tag.lower()
-        for index in range(len(self._stack) - 1, 0, -1):
-            if self._stack[index].name.lower() == tag_lower:
-                del self._stack[index:]
-                break
+        positions = self._open_positions.get(tag)
+        if not positions:
+            return
+        index = positions[-1]
+        # Every element closed here is the innermost open one of its name.
+        for closed in self._stack[index:]:
+            self._open_positions[closed.name].pop()
+        del self._stack[index:]
 
     def handle_data(self, data: str) -> None:
         if not data:
@@ -156,9 +218,29 @@ class HtmlCleaner(BaseCleaner):
 
     TAGS_TO_REMOVE = {"script", "style", "nav", "footer", "header", "noscript", "aside"}
     HEADING_LEVEL_PREFIX = {level: "#" * level for level in range(1, 7)}
+    HEADING_TAGS = frozenset(f"h{level}" for level in range(1, 7))
+    LIST_TAGS = frozenset({"ul", "ol"})
+    NESTED_BLOCK_TAGS = frozenset({"ul", "ol", "table"})
+    CONTAINER_TAGS = frozenset({"div", "section", "article", "main", "body"})
+    LIST_ITEM_TAGS = frozenset({"li"})
+    TABLE_ROW_TAGS = frozenset({"tr"})
+    TABLE_CELL_TAGS = frozenset({"th", "td"})
 
     def __init__(self) -> None:
         self._logger = LOGGER
+        # Tag name -> renderer; unknown tags fall through to ``_render_default``.
+        self._dispatch: Dict[str, Callable[[Tag, List[str], int], None]] = {
+            **dict.fromkeys(self.HEADING_TAGS, self._render_heading),
+            **dict.fromkeys(self.CONTAINER_TAGS, self._render_container),
+            "p": self._render_paragraph,
+            "pre": self._render_pre,
+            "blockquote": self._render_quote,
+            "ul": self._render_ul,
+            "ol": self._render_ol,
+            "table": self._render_table_block,
+            "br": self._render_br,
+            "a": self._render_anchor,
+        }
 
     def clean(self, file_path: str) -> str:
         """Clean the provided HTML file and return normalized Markdown text."""
@@ -172,30 +254,71 @@ class HtmlCleaner(BaseCleaner):
         html_content = path.read_text(encoding="utf-8", errors="ignore")
         soup = self._parse_html(html_content)
 
-        self._strip_unwanted_nodes(soup)
+        removables, headings, titles = self._scan(soup)
+        self._strip_unwanted_nodes(soup, removables)
         root = getattr(soup, "body", None) or soup
+        # The ``_emit_*`` helpers keep ``lines`` compact as they go: entries
+        # are stripped, there are no leading or doubled blanks, and only a
+        # trailing blank can remain.
         lines: List[str] = []
         self._render_children(root, lines, indent=0)
+        if lines and lines[-1] == "":
+            lines.pop()
 
-        compacted = self._compact_lines(lines)
-        ensured = self._ensure_heading(soup, compacted)
-        normalized = unicodedata.normalize("NFKC", "\n".join(ensured)).strip()
+        ensured = self._ensure_heading(lines, headings, titles)
+        joined = "\n".join(ensured)
+        # NFKC leaves ASCII untouched; isascii() is a constant-time flag check.
+        normalized = (joined if joined.isascii() else unicodedata.normalize("NFKC", joined)).strip()
         return self._strip_bom(normalized)
 
     def _parse_html(self, html_content: str) -> Union[SimpleDocument, BeautifulSoup]:
         """Parse HTML content returning either BeautifulSoup or fallback tree."""
 
         if BeautifulSoup is not None:
-            return BeautifulSoup(html_content, "html.parser")
+            return BeautifulSoup(html_content, _PARSER_NAME)
         return _fallback_soup(html_content)
 
+    def _scan(
+        self, root: Union[SimpleDocument, BeautifulSoup]
+    ) -> Tuple[List[Tag], List[Tag], List[Tag]]:
+        """Walk the tree once collecting removable nodes and heading candidates.
+
+        Returns ``(removables, headings, titles)`` in document order. Nodes
+        nested inside a removable element are skipped because they are
+        discarded together with it.
+        """
+
+        element_type = SimpleNode if isinstance(root, SimpleNode) else Tag
+        removables: List[Tag] = []
+        headings: List[Tag] = []
+        titles: List[Tag] = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            name = node.name
+            if name in self.TAGS_TO_REMOVE:
+                removables.append(node)
+                continue
+            if name == "h1":
+                headings.append(node)
+            elif name == "title":
+                titles.append(node)
+            children = node.children if element_type is SimpleNode else node.contents
+            stack.extend(child for child in reversed(children) if isinstance(child, element_type))
+        return removables, headings, titles
+
     def _strip_unwanted_nodes(
-        self, soup: Union[SimpleDocument, BeautifulSoup]
+        self,
+        soup: Union[SimpleDocument, BeautifulSoup],
+        removables: Sequence[Tag],
     ) -> None:
         """Remove noisy nodes such as scripts, styles and comments."""
 
-        for removable in self._find_all(soup, self.TAGS_TO_REMOVE):
-            removable.decompose()
+        if isinstance(soup, SimpleNode):
+            SimpleNode.decompose_all(removables)  # type: ignore[arg-type]
+        else:
+            for removable in removables:
+                removable.decompose()
         if BeautifulSoup is not None:
             for comment in soup.find_all(string=lambda item: isinstance(item, Comment)):  # type: ignore[attr-defined]
                 comment.extract()  # type: ignore[call-arg]
@@ -216,67 +339,91 @@ class HtmlCleaner(BaseCleaner):
     def _render_tag(self, tag: Tag, lines: List[str], indent: int) -> None:
         """Render an individual tag into Markdown lines."""
 
-        name = tag.name.lower()
-        if name in {f"h{level}" for level in range(1, 7)}:
-            level = min(int(name[1]), 6)
-            content = self._collect_inline_text(tag)
-            if content:
-                prefix = self.HEADING_LEVEL_PREFIX.get(level, "##")
-                self._emit_block(lines, f"{prefix} {content}")
-        elif name in {"p", "pre", "blockquote"}:
-            content = self._collect_inline_text(tag)
-            if content:
-                if name == "pre":
-                    self._emit_block(lines, f"```\n{content}\n```")
-                elif name == "blockquote":
-                    quoted = "\n".join(f"> {line}" for line in content.splitlines() if line.strip())
-                    self._emit_block(lines, quoted)
-                else:
-                    self._emit_block(lines, content)
-        elif name in {"ul", "ol"}:
-            ordered = name == "ol"
-            self._emit_list(tag, lines, indent, ordered=ordered)
-        elif name == "table":
-            table_lines = self._render_table(tag)
-            if table_lines:
-                self._emit_block(lines, "\n".join(table_lines))
-        elif name in {"br"}:
-            self._emit_blank_line(lines)
-        elif name == "a":
-            content = self._collect_inline_text(tag)
-            href = (tag.get("href") or "").strip() if hasattr(tag, "get") else ""
-            if content and href:
-                self._emit_block(lines, self._format_link(content, href))
-            elif content:
-                self._emit_block(lines, content)
-            elif href:
-                self._emit_block(lines, self._format_link(href, href))
-        elif name in {"div", "section", "article", "main", "body"} or name.startswith("sr-"):
-            self._render_children(tag, lines, indent)
-        else:
-            # Default behaviour: attempt to render inline content.
-            content = self._collect_inline_text(tag)
-            if content:
-                self._emit_block(lines, content)
-            # Also render nested structures such as lists or tables.
-            for nested in self._find_all(tag, {"ul", "ol", "table"}, recursive=False):
-                self._render_tag(nested, lines, indent)
+        name = tag.name
+        handler = self._dispatch.get(name)
+        if handler is None and name.startswith("sr-"):
+            handler = self._render_container
+        (handler or self._render_default)(tag, lines, indent)
+
+    def _render_heading(self, tag: Tag, lines: List[str], indent: int) -> None:
+        content = self._collect_inline_text(tag)
+        if content:
+            prefix = self.HEADING_LEVEL_PREFIX.get(int(tag.name[1]), "##")
+            self._emit_block(lines, f"{prefix} {content}")
+
+    def _render_paragraph(self, tag: Tag, lines: List[str], indent: int) -> None:
+        content = self._collect_inline_text(tag)
+        if content:
+            self._emit_block(lines, content)
+
+    def _render_pre(self, tag: Tag, lines: List[str], indent: int) -> None:
+        content = self._collect_inline_text(tag)
+        if content:
+            self._emit_block(lines, f"```\n{content}\n```")
+
+    def _render_quote(self, tag: Tag, lines: List[str], indent: int) -> None:
+        content = self._collect_inline_text(tag)
+        if content:
+            quoted = "\n".join(f"> {line}" for line in content.splitlines() if line.strip())
+            self._emit_block(lines, quoted)
+
+    def _render_ul(self, tag: Tag, lines: List[str], indent: int) -> None:
+        self._emit_list(tag, lines, indent, ordered=False)
+
+    def _render_ol(self, tag: Tag, lines: List[str], indent: int) -> None:
+        self._emit_list(tag, lines, indent, ordered=True)
+
+    def _render_table_block(self, tag: Tag, lines: List[str], indent: int) -> None:
+        table_lines = self._render_table(tag)
+        if table_lines:
+            self._emit_block(lines, "\n".join(table_lines))
+
+    def _render_br(self, tag: Tag, lines: List[str], indent: int) -> None:
+        self._emit_blank_line(lines)
+
+    def _render_anchor(self, tag: Tag, lines: List[str], indent: int) -> None:
+        markdown = self._anchor_markdown(tag)
+        if markdown:
+            self._emit_block(lines, markdown)
+
+    def _anchor_markdown(self, tag: Tag) -> str:
+        """Return Markdown for an ``<a>`` element, or ``""`` when it is empty."""
+
+        content = self._collect_inline_text(tag)
+        href = (tag.get("href") or "").strip()
+        if href:
+            return self._format_link(content or href, href)
+        return content
+
+    def _render_container(self, tag: Tag, lines: List[str], indent: int) -> None:
+        self._render_children(tag, lines, indent)
+
+    def _render_default(self, tag: Tag, lines: List[str], indent: int) -> None:
+        # Default behaviour: attempt to render inline content.
+        content = self._collect_inline_text(tag)
+        if content:
+            self._emit_block(lines, content)
+        # Also render nested structures such as lists or tables.
+        for nested in self._find_all(tag, self.NESTED_BLOCK_TAGS, recursive=False):
+            self._render_tag(nested, lines, indent)
 
     def _emit_list(self, tag: Tag, lines: List[str], indent: int, *, ordered: bool) -> None:
         """Render unordered/ordered lists."""
 
-        items = self._find_all(tag, {"li"}, recursive=False)
+        items = self._find_all(tag, self.LIST_ITEM_TAGS, recursive=False)
         if not items:
             return
         if lines and lines[-1] != "":
             lines.append("")
         start = int(tag.get("start", 1)) if ordered else 1
         counter = start
+        # Indentation depends only on the nesting depth; build it once per list.
+        list_indent = "  " * indent
+        continuation_indent = f"{list_indent}  "
+        bullet_prefix = f"{list_indent}- "
         for item in items:
             content = self._collect_inline_text(item)
-            prefix = f"{counter}. " if ordered else "- "
-            list_indent = "  " * indent
-            line_prefix = f"{list_indent}{prefix}"
+            line_prefix = f"{list_indent}{counter}. " if ordered else bullet_prefix
             if content:
                 content_lines = content.split("\n")
                 first = content_lines[0].strip()
@@ -284,45 +431,68 @@ class HtmlCleaner(BaseCleaner):
                     lines.append(f"{line_prefix}{first}")
                 else:
                     lines.append(line_prefix.rstrip())
-                continuation_indent = f"{list_indent}  "
                 for continuation in content_lines[1:]:
                     continuation = continuation.strip()
                     if continuation:
                         lines.append(f"{continuation_indent}{continuation}")
             else:
                 lines.append(line_prefix.rstrip())
-            nested_lists = self._find_all(item, {"ul", "ol"}, recursive=False)
+            nested_lists = self._find_all(item, self.LIST_TAGS, recursive=False)
             for nested in nested_lists:
                 self._emit_list(
                     nested,
                     lines,
                     indent=indent + 1,
-                    ordered=(nested.name.lower() == "ol"),
+                    ordered=(nested.name == "ol"),
                 )
             if ordered:
                 counter += 1
-        lines.append("")
+        self._emit_blank_line(lines)
 
     def _render_table(self, tag: Tag) -> List[str]:
         """Render HTML table into a Markdown table."""
 
         header_rows: List[List[str]] = []
         body_rows: List[List[str]] = []
-
-        for row in self._find_all(tag, {"tr"}):
+        widths: List[int] = []
+
+        # One pre-order walk over the table; rows of nested tables are
+        # included, matching a recursive ``find_all("tr")``.
+        element_type = SimpleNode if isinstance(tag, SimpleNode) else Tag
+        stack = [tag]
+        while stack:
+            node = stack.pop()
+            children = [
+                child
+                for child in (node.children if element_type is SimpleNode else node.contents)
+                if isinstance(child, element_type)
+            ]
+            stack.extend(reversed(children))
+            if node is tag or node.name not in self.TABLE_ROW_TAGS:
+                continue
             cells: List[str] = []
             is_header = False
-            for cell in self._find_all(row, {"th", "td"}, recursive=False):
+            for cell in children:
+                if cell.name not in self.TABLE_CELL_TAGS:
+                    continue
                 content = self._collect_inline_text(cell)
                 cells.append(content)
-                if cell.name.lower() == "th":
+                if cell.name == "th":
                     is_header = True
             if not cells:
                 continue
             if is_header:
                 header_rows.append(cells)
+                if len(header_rows) > 1:
+                    # Only the first header row is rendered.
+                    continue
             else:
                 body_rows.append(cells)
+            for idx, content in enumerate(cells):
+                if idx < len(widths):
+                    widths[idx] = max(widths[idx], len(content))
+                else:
+                    widths.append(len(content))
 
         if not header_rows and not body_rows:
             return []
@@ -333,88 +503,87 @@ class HtmlCleaner(BaseCleaner):
             header = body_rows.pop(0)
 
         rows = [header] + body_rows
-        column_count = max(len(row) for row in rows)
+        column_count = len(widths)
         for row in rows:
             while len(row) < column_count:
                 row.append("")
 
-        widths = [
-            max(len(row[idx]) for row in rows)
-            for idx in range(column_count)
-        ]
-
-        def format_row(row: Sequence[str]) -> str:
-            padded = [row[idx].ljust(widths[idx]) for idx in range(column_count)]
-            return "| " + " | ".join(padded) + " |"
-
-        separator = "| " + " | ".join("-" * max(widths[idx], 3) for idx in range(column_count)) + " |"
-        table_lines = [format_row(header), separator]
-        for body_row in body_rows:
-            table_lines.append(format_row(body_row))
+        # One format string pads every cell of a row in a single C-level call.
+        row_format = "| " + " | ".join(f"{{:<{width}}}" for width in widths) + " |"
+        separator = "| " + " | ".join("-" * max(width, 3) for width in widths) + " |"
+        table_lines = [row_format.format(*header), separator]
+        table_lines.extend(row_format.format(*body_row) for body_row in body_rows)
         return table_lines
 
     def _collect_inline_text(self, node: Tag) -> str:
         """Collect inline text from the given node while skipping block-level structures."""
 
-        parts: List[str] = []
+        buffer: List[str] = []
+        self._collect_inline_into(node, buffer)
+        return self._finalize_inline("".join(buffer))
+
+    def _collect_inline_into(self, node: Tag, buffer: List[str]) -> None:
+        """Append the inline text segments of ``node`` to ``buffer``.
+
+        Nested elements write into the same buffer so the regex clean-up in
+        ``_finalize_inline`` runs once per outermost call. Each nested
+        element's segment is trimmed like a standalone inline text would be.
+        """
+
         for child in getattr(node, "children", []):
             if isinstance(child, (NavigableString, str)):
                 text = self._normalize_inline_text(str(child))
                 if text:
-                    parts.append(text)
-            elif isinstance(child, Tag):
-                name = child.name.lower()
+                    buffer.append(text)
+            elif isinstance(child, (Tag, SimpleNode)):
+                name = child.name
                 if name in self.TAGS_TO_REMOVE:
                     continue
                 if name == "br":
-                    parts.append("\n")
+                    buffer.append("\n")
                     continue
-                if name in {"ul", "ol", "table"}:
+                if name in self.NESTED_BLOCK_TAGS:
                     continue
                 if name == "a":
-                    anchor_text = self._collect_inline_text(child)
-                    href = child.get("href", "").strip()
-                    if anchor_text:
-                        if href:
-                            parts.append(self._format_link(anchor_text, href))
-                        else:
-                            parts.append(anchor_text)
-                    elif href:
-                        parts.append(self._format_link(href, href))
+                    markdown = self._anchor_markdown(child)
+                    if markdown:
+                        buffer.append(markdown)
                     continue
-                nested = self._collect_inline_text(child)
-                if nested:
-                    parts.append(nested)
-            elif isinstance(child, SimpleNode):
-                name = child.name.lower()
-                if name in self.TAGS_TO_REMOVE:
-                    continue
-                if name == "br":
-                    parts.append("\n")
-                    continue
-                if name in {"ul", "ol", "table"}:
-                    continue
-                if name == "a":
-                    anchor_text = self._collect_inline_text(child)
-                    href = (child.attrs.get("href") or "").strip()
-                    if anchor_text:
-                        if href:
-                            parts.append(self._format_link(anchor_text, href))
-                        else:
-                            parts.append(anchor_text)
-                    elif href:
-                        parts.append(self._format_link(href, href))
-                    continue
-                nested = self._collect_inline_text(child)
-                if nested:
-                    parts.append(nested)
-        text = "".join(parts)
+                start = len(buffer)
+                self._collect_inline_into(child, buffer)
+                self._strip_segment(buffer, start)
+
+    @staticmethod
+    def _strip_segment(buffer: List[str], start: int) -> None:
+        """Strip surrounding whitespace from the entries ``buffer[start:]``."""
+
+        while len(buffer) > start:
+            head = buffer[start].lstrip()
+            if head:
+                buffer[start] = head
+                break
+            del buffer[start]
+        while len(buffer) > start:
+            tail = buffer[-1].rstrip()
+            if tail:
+                buffer[-1] = tail
+                break
+            buffer.pop()
+
+    def _finalize_inline(self, text: str) -> str:
+        """Collapse whitespace in collected inline text and trim it."""
+
         if not text:
             return ""
         text = text.replace("\r", "")
-        text = re.sub(r"[ \t\f\v]+", " ", text)
-        text = re.sub(r" ?\n ?", "\n", text)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        # Text nodes arrive already collapsed by ``_normalize_inline_text``;
+        # only run a pass when its pattern can actually match.
+        if "  " in text or "\t" in text or "\f" in text or "\v" in text:
+            text = _HORIZONTAL_SPACE_RE.sub(" ", text)
+        if " \n" in text or "\n " in text:
+            text = _NEWLINE_PADDING_RE.sub("\n", text)
+        if "\n\n\n" in text:
+            text = _EXCESS_NEWLINES_RE.sub("\n\n", text)
         return self._strip_bom(text).strip()
 
     def _emit_block(self, lines: List[str], content: str) -> None:
@@ -428,40 +597,25 @@ class HtmlCleaner(BaseCleaner):
         lines.append(content)
 
     def _emit_blank_line(self, lines: List[str]) -> None:
-        """Append a blank line avoiding duplicates."""
+        """Append a blank line avoiding duplicates and leading blanks."""
 
-        if lines and lines[-1] == "":
+        if not lines or lines[-1] == "":
             return
         lines.append("")
 
-    def _compact_lines(self, lines: Iterable[str]) -> List[str]:
-        """Collapse consecutive blank lines and strip trailing empty entries."""
-
-        result: List[str] = []
-        previous_blank = True
-        for raw_line in lines:
-            line = self._strip_bom(raw_line).rstrip()
-            if not line:
-                if not previous_blank:
-                    result.append("")
-                previous_blank = True
-            else:
-                result.append(line)
-                previous_blank = False
-        while result and result[-1] == "":
-            result.pop()
-        return result
-
     def _normalize_whitespace(self, text: str) -> str:
         """Normalize whitespace within inline content."""
 
-        return re.sub(r"\s+", " ", text)
+        return _WHITESPACE_RE.sub(" ", text)
 
     def _normalize_inline_text(self, text: str) -> str:
         """Normalize inline string segments while preserving explicit newlines."""
 
         text = self._strip_bom(text.replace("\r", ""))
-        text = re.sub(r"[ \t\f\v]+", " ", text)
+        # Most text nodes hold only single spaces; skip the regex when nothing
+        # would collapse.
+        if "  " in text or "\t" in text or "\f" in text or "\v" in text:
+            text = _HORIZONTAL_SPACE_RE.sub(" ", text)
         return text
 
     def _find_all(
@@ -470,32 +624,28 @@ class HtmlCleaner(BaseCleaner):
         names: Union[Set[str], Sequence[str]],
         recursive: bool = True,
     ) -> List[Union[SimpleNode, Tag]]:
-        """Helper to support find_all across BeautifulSoup and fallback nodes."""
+        """Helper to support find_all across BeautifulSoup and fallback nodes.
+
+        ``SimpleNode.find_all`` mirrors the BeautifulSoup signature, so both
+        node kinds share one call without per-call type checks.
+        """
 
-        if BeautifulSoup is not None and hasattr(node, "find_all"):
-            return node.find_all(names, recursive=recursive)  # type: ignore[return-value]
-        if isinstance(node, SimpleDocument):
-            return node.find_all(names, recursive=recursive)
-        if isinstance(node, SimpleNode):
-            return node.find_all(names, recursive=recursive)
-        return []
+        return node.find_all(names, recursive=recursive)  # type: ignore[return-value]
 
     def _strip_comments(self, node: SimpleNode) -> None:
         """Remove comment nodes when using the fallback parser."""
 
-        filtered_children: List[Union[SimpleNode, str]] = []
-        for child in node.children:
-            if isinstance(child, Comment):
-                continue
-            if isinstance(child, SimpleNode):
-                self._strip_comments(child)
-            filtered_children.append(child)
-        node.children = filtered_children
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            current.children = [child for child in current.children if not isinstance(child, Comment)]
+            stack.extend(child for child in current.children if isinstance(child, SimpleNode))
 
     def _strip_bom(self, text: str) -> str:
         """Remove UTF-8 BOM characters from the provided text."""
 
-        return text.replace("\ufeff", "")
+        # BOMs are rare; the membership test is cheaper than a no-op replace.
+        return text.replace("\ufeff", "") if "\ufeff" in text else text
 
     def _format_link(self, text: str, href: str) -> str:
         """Return a Markdown formatted link."""
@@ -512,8 +662,9 @@ class HtmlCleaner(BaseCleaner):
 
     def _ensure_heading(
         self,
-        root: Union[SimpleDocument, BeautifulSoup],
         lines: List[str],
+        headings: Sequence[Tag],
+        titles: Sequence[Tag],
     ) -> List[str]:
         """Ensure output begins with a Markdown heading derived from content or title."""
 
@@ -533,12 +684,12 @@ class HtmlCleaner(BaseCleaner):
             return lines
 
         heading_text = ""
-        for candidate in self._find_all(root, {"h1"}):
+        for candidate in headings:
             heading_text = self._strip_bom(self._collect_inline_text(candidate))
             if heading_text:
                 break
         if not heading_text:
-            for candidate in self._find_all(root, {"title"}):
+            for candidate in titles:
                 heading_text = self._strip_bom(self._collect_inline_text(candidate))
                 if heading_text:
                     break
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
 import unicodedata
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from statistics import median
-from typing import Dict, List, Sequence
+from typing import Dict, Iterable, Iterator, List, Sequence
 
 import pdfplumber
 
@@ -26,8 +28,12 @@ from .base import BaseCleaner
 
 LOGGER = logging.getLogger(__name__)
 
+# First characters from which ``PdfCleaner.BULLET_PATTERN`` can match a roman
+# numeral; includes the dotted/dotless "i" that match under IGNORECASE.
+_ROMAN_NUMERAL_INITIALS = frozenset("ivxlcdmIVXLCDM\u0130\u0131")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class _Word:
     """Internal representation of a PDF word enriched with metadata."""
 
@@ -38,36 +44,7 @@ class _Word:
     x0: float
     size: float
     fontname: str
-
-    @classmethod
-    def from_pdfplumber(cls, raw_word: Dict[str, object]) -> "_Word":
-        """Build a word instance from the dictionary returned by pdfplumber."""
-
-        text = str(raw_word.get("text", "")).strip()
-        top = float(raw_word.get("top", 0.0))
-        bottom = float(raw_word.get("bottom", 0.0))
-        x0 = float(raw_word.get("x0", 0.0))
-        x1 = float(raw_word.get("x1", x0))
-        size = float(raw_word.get("size", 0.0))
-        fontname = str(raw_word.get("fontname", ""))
-        return cls(
-            text=text,
-            x1=x1,
-            top=top,
-            bottom=bottom,
-            x0=x0,
-            size=size,
-            fontname=fontname,
-        )
-
-    def is_heading_candidate(self, baseline_size: float, size_multiplier: float) -> bool:
-        """Return whether the word should be considered part of a heading."""
-
-        if not self.text:
-            return False
-        larger_font = baseline_size > 0 and self.size >= baseline_size * size_multiplier
-        bold_font = "bold" in self.fontname.lower()
-        return larger_font or bold_font
+    bold: bool = False
 
 
 class PdfCleaner(BaseCleaner):
@@ -87,21 +64,27 @@ class PdfCleaner(BaseCleaner):
     NUMERIC_NOISE_PATTERN = re.compile(r"^[0-9\s]+$")
     UPPER_LETTER_PATTERN = re.compile(r"^[A-Z]\.?$")
     BULLET_PATTERN = re.compile(r"^(?:\d+[).]|[ivxlcdm]+\.)", re.IGNORECASE)
+    PARALLEL_PAGE_THRESHOLD = 4
 
-    def __init__(self) -> None:
+    def __init__(self, max_workers: int | None = None) -> None:
         self._logger = LOGGER
+        self._max_workers = max_workers or os.cpu_count() or 1
 
     def clean(self, file_path: str) -> str:
         """Clean the provided PDF file and return normalized UTF-8 text."""
 
         try:
+            page_texts: List[str] | None = None
             with pdfplumber.open(file_path) as pdf:
-                pages_content: List[str] = []
-                for page_number, page in enumerate(pdf.pages, start=1):
-                    page_text = self._process_page(page, page_number)
-                    if page_text:
-                        pages_content.append(page_text)
-                cleaned = "\n\n".join(pages_content)
+                page_count = len(pdf.pages)
+                if page_count < self.PARALLEL_PAGE_THRESHOLD or self._max_workers == 1:
+                    page_texts = [
+                        self._process_page(page, page_number)
+                        for page_number, page in enumerate(pdf.pages, start=1)
+                    ]
+            if page_texts is None:
+                page_texts = self._process_pages_in_parallel(file_path, page_count)
+            cleaned = "\n\n".join(filter(None, page_texts))
         except (PdfPlumberSyntaxError, PdfMinerSyntaxError) as exc:
             msg = f"Failed to parse PDF file: {file_path}"
             self._logger.exception(msg)
@@ -111,8 +94,22 @@ class PdfCleaner(BaseCleaner):
             self._logger.exception(msg)
             raise ValueError(msg) from exc
 
-        normalized = unicodedata.normalize("NFKC", cleaned)
-        return normalized.strip()
+        return cleaned.strip()
+
+    def _process_pages_in_parallel(self, file_path: str, page_count: int) -> List[str]:
+        """Process contiguous page ranges in worker processes preserving page order."""
+
+        workers = min(self._max_workers, page_count)
+        step = -(-page_count // workers)
+        # Workers rebuild this cleaner's own class so subclasses overriding
+        # thresholds or page helpers clean the same way as the serial path.
+        cleaner_cls = type(self)
+        tasks = [
+            (cleaner_cls, file_path, start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+        with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+            return [text for texts in executor.map(_clean_page_range, tasks) for text in texts]
 
     def _process_page(self, page: pdfplumber.page.Page, page_number: int) -> str:
         """Process a single PDF page and return the cleaned textual representation."""
@@ -121,32 +118,47 @@ class PdfCleaner(BaseCleaner):
         if not words:
             self._logger.debug("Page %s yielded no words after filtering", page_number)
             fallback = page.extract_text() or ""
-            return fallback.strip()
+            return _normalize_nfkc(fallback.strip())
 
-        baseline_size = self._determine_body_font_size(words)
-        line_gap_threshold = self._estimate_line_gap(words)
+        baseline_size, line_gap_threshold = self._page_stats(words)
+        heading_threshold = self._heading_size_threshold(baseline_size)
+        # A line can only be a heading if one of its words qualifies, so a
+        # page without any qualifying word skips the per-line checks.
+        page_has_headings = self._is_heading_line(words, heading_threshold)
         lines = self._group_words_by_line(words)
         normalized_lines = self._split_line_segments(lines, baseline_size, page.width)
         ordered_columns = self._order_lines_into_columns(normalized_lines, page.width)
 
+        # Bound methods hoisted out of the per-line loop below.
+        assemble_line = self._assemble_line
+        append_line = self._append_line_with_continuation
+        append_blank_line = self._append_blank_line
+
         assembled_lines: List[str] = []
         for idx, column_lines in enumerate(ordered_columns):
             column_output: List[str] = []
             previous_top: float | None = None
+            # Most recent non-empty entry of ``column_output``, tracked as we
+            # go instead of scanning backwards on every paragraph gap.
+            last_line = ""
             for top, line_words in column_lines:
                 if previous_top is not None and (top - previous_top) > line_gap_threshold:
-                    last_line = self._last_non_empty_line(column_output)
                     if last_line and not last_line.startswith("## "):
-                        self._append_blank_line(column_output)
-                text = self._assemble_line(line_words, baseline_size)
-                self._append_line_with_continuation(column_output, text)
+                        append_blank_line(column_output)
+                text = assemble_line(line_words, heading_threshold, page_has_headings)
+                append_line(column_output, text)
+                if column_output and column_output[-1]:
+                    last_line = column_output[-1]
                 if text:
                     previous_top = top
             assembled_lines.extend(column_output)
             if idx < len(ordered_columns) - 1 and column_output:
-                self._append_blank_line(assembled_lines)
+                append_blank_line(assembled_lines)
 
-        return "\n".join(line for line in assembled_lines if line is not None).strip()
+        page_text = "\n".join(assembled_lines).strip()
+        # NFKC never composes across the newline page separators, so
+        # normalising per page matches normalising the joined document.
+        return _normalize_nfkc(page_text)
 
     def _extract_filtered_words(self, page: pdfplumber.page.Page) -> List[_Word]:
         """Extract words from the page while removing header and footer content."""
@@ -159,49 +171,91 @@ class PdfCleaner(BaseCleaner):
         header_cutoff = page.height * self.HEADER_RATIO
         footer_cutoff = page.height * self.FOOTER_RATIO
 
+        # Each field is read and converted once, and rejected words (header,
+        # footer or blank) are dropped before any ``_Word`` is allocated.
         filtered: List[_Word] = []
+        # A page uses a handful of fonts; derive each font's bold flag once
+        # instead of lower-casing the name for every word.
+        bold_fonts: Dict[str, bool] = {}
         for raw_word in raw_words:
-            word = _Word.from_pdfplumber(raw_word)
-            if not word.text:
+            top = float(raw_word.get("top", 0.0))
+            if top < header_cutoff:
                 continue
-            if word.top < header_cutoff:
+            bottom = float(raw_word.get("bottom", 0.0))
+            if bottom > footer_cutoff:
                 continue
-            if word.bottom > footer_cutoff:
+            text = str(raw_word.get("text", "")).strip()
+            if not text:
                 continue
-            filtered.append(word)
+            x0 = float(raw_word.get("x0", 0.0))
+            fontname = str(raw_word.get("fontname", ""))
+            bold = bold_fonts.get(fontname)
+            if bold is None:
+                bold = bold_fonts[fontname] = "bold" in fontname.lower()
+            filtered.append(
+                _Word(
+                    text,
+                    float(raw_word.get("x1", x0)),
+                    top,
+                    bottom,
+                    x0,
+                    float(raw_word.get("size", 0.0)),
+                    fontname,
+                    bold,
+                )
+            )
         return filtered
 
-    def _determine_body_font_size(self, words: Sequence[_Word]) -> float:
-        """Estimate the baseline body font size using the median of all words."""
+    def _page_stats(self, words: Sequence[_Word]) -> tuple[float, float]:
+        """Return the body font size and paragraph gap threshold in one pass.
 
-        sizes = [word.size for word in words if word.size > 0]
-        if not sizes:
-            return 0.0
-        return float(median(sizes))
+        The body font size is the median of all positive word sizes and the
+        gap threshold is twice the median word height.
+        """
 
-    def _group_words_by_line(self, words: Sequence[_Word]) -> List[tuple[float, List[_Word]]]:
-        """Group words into lines based on their vertical positioning."""
-
-        lines: Dict[float, List[_Word]] = defaultdict(list)
+        sizes: List[float] = []
+        heights: List[float] = []
         for word in words:
-            line_key = round(word.top, 1)
-            lines[line_key].append(word)
+            if word.size > 0:
+                sizes.append(word.size)
+            if word.bottom >= word.top:
+                heights.append(word.bottom - word.top)
+        baseline_size = float(median(sizes)) if sizes else 0.0
+        line_gap = float(median(heights) * 2.0) if heights else 12.0
+        return baseline_size, line_gap
+
+    def _group_words_by_line(self, words: Sequence[_Word]) -> Iterator[tuple[float, List[_Word]]]:
+        """Yield words grouped into lines based on their vertical positioning.
+
+        Lines are produced lazily so ``_split_line_segments`` consumes each
+        one as it is completed instead of a second page-sized list.
+        """
+
+        keyed = sorted(
+            ((round(word.top, 1), word) for word in words),
+            key=lambda item: (item[0], item[1].x0),
+        )
 
-        sorted_lines: List[tuple[float, List[_Word]]] = []
-        for top in sorted(lines.keys()):
-            line_words = sorted(lines[top], key=lambda item: item.x0)
-            sorted_lines.append((top, line_words))
-        return sorted_lines
+        current_top: float | None = None
+        current_words: List[_Word] = []
+        for top, word in keyed:
+            if top != current_top:
+                if current_words:
+                    yield current_top, current_words
+                current_top = top
+                current_words = []
+            current_words.append(word)
+        if current_words:
+            yield current_top, current_words
 
     def _split_line_segments(
         self,
-        lines: Sequence[tuple[float, List[_Word]]],
+        lines: Iterable[tuple[float, List[_Word]]],
         baseline_size: float,
         page_width: float,
-    ) -> List[tuple[float, List[_Word]]]:
-        """Split lines containing multiple columns into separate segments."""
+    ) -> Iterator[tuple[float, List[_Word]]]:
+        """Yield lines split into separate segments at multi-column gaps."""
 
-        normalized: List[tuple[float, List[_Word]]] = []
         gap_threshold = max(baseline_size * self.COLUMN_GAP_MULTIPLIER, self.MIN_COLUMN_GAP)
         width_threshold = max(
             gap_threshold,
@@ -211,43 +265,34 @@ class PdfCleaner(BaseCleaner):
         for top, line_words in lines:
             if not line_words:
                 continue
-            segments: List[List[_Word]] = []
-            current_segment: List[_Word] = [line_words[0]]
-            previous_word = line_words[0]
-
-            for word in line_words[1:]:
-                gap = word.x0 - previous_word.x1
-                if gap > width_threshold:
-                    segments.append(current_segment)
-                    current_segment = [word]
-                else:
-                    current_segment.append(word)
-                previous_word = word
-
-            segments.append(current_segment)
-
-            for segment in segments:
-                if segment:
-                    normalized.append((top, segment))
-
-        normalized.sort(key=lambda item: (item[0], item[1][0].x0))
-        return normalized
+            # Cut the line at wide gaps by slicing instead of copying words
+            # one at a time; lines without a gap are passed through as-is.
+            segment_start = 0
+            for index in range(1, len(line_words)):
+                if line_words[index].x0 - line_words[index - 1].x1 > width_threshold:
+                    yield top, line_words[segment_start:index]
+                    segment_start = index
+            yield top, line_words[segment_start:] if segment_start else line_words
+
+        # Lines arrive ordered by (top, x0) from ``_group_words_by_line`` and
+        # segments keep that order, so no re-sort is needed.
 
     def _order_lines_into_columns(
         self,
-        lines: Sequence[tuple[float, List[_Word]]],
+        lines: Iterable[tuple[float, List[_Word]]],
         page_width: float,
     ) -> List[List[tuple[float, List[_Word]]]]:
         """Group lines into columns when multi-column layout is detected."""
 
-        if not lines:
+        # The only page-sized list of lines: grouping and segment splitting
+        # feed it lazily, one line at a time.
+        line_centroid = self._line_centroid
+        line_meta: List[tuple[float, List[_Word], float]] = [
+            (top, line_words, line_centroid(line_words)) for top, line_words in lines
+        ]
+        if not line_meta:
             return []
 
-        line_meta: List[tuple[float, List[_Word], float]] = []
-        for top, line_words in lines:
-            centroid = self._line_centroid(line_words)
-            line_meta.append((top, line_words, centroid))
-
         boundary = self._detect_column_boundary(
             [meta[2] for meta in line_meta],
             page_width,
@@ -281,8 +326,19 @@ class PdfCleaner(BaseCleaner):
     def _line_centroid(self, line_words: Sequence[_Word]) -> float:
         """Return the median horizontal position of the words composing a line."""
 
-        positions = [(word.x0 + word.x1) / 2 for word in line_words]
-        return float(median(positions)) if positions else 0.0
+        # Inline median: most lines hold one or two words, for which the
+        # generic statistics.median call overhead dominates.
+        count = len(line_words)
+        if count == 1:
+            word = line_words[0]
+            return (word.x0 + word.x1) / 2
+        if not count:
+            return 0.0
+        positions = sorted((word.x0 + word.x1) / 2 for word in line_words)
+        middle = count // 2
+        if count % 2:
+            return positions[middle]
+        return (positions[middle - 1] + positions[middle]) / 2
 
     def _detect_column_boundary(
         self,
@@ -312,23 +368,23 @@ class PdfCleaner(BaseCleaner):
 
         return boundary
 
-    def _estimate_line_gap(self, words: Sequence[_Word]) -> float:
-        """Estimate a threshold to detect paragraph gaps between lines."""
-
-        heights = [word.bottom - word.top for word in words if word.bottom >= word.top]
-        if not heights:
-            return 12.0
-        baseline_height = median(heights)
-        return float(baseline_height * 2.0)
+    def _assemble_line(
+        self,
+        line_words: Sequence[_Word],
+        heading_threshold: float,
+        detect_headings: bool = True,
+    ) -> str:
+        """Assemble words into a single line and decorate headings when detected.
 
-    def _assemble_line(self, line_words: Sequence[_Word], baseline_size: float) -> str:
-        """Assemble words into a single line and decorate headings when detected."""
+        ``detect_headings`` may be ``False`` when the caller already knows no
+        word on the page qualifies as a heading.
+        """
 
         text = " ".join(word.text for word in line_words).strip()
         if not text:
             return ""
 
-        if self._is_heading_line(line_words, baseline_size):
+        if detect_headings and self._is_heading_line(line_words, heading_threshold):
             normalized = text.lstrip("# ")
             text = f"## {normalized}".strip()
 
@@ -354,20 +410,14 @@ class PdfCleaner(BaseCleaner):
         if not lines or lines[-1] != "":
             lines.append("")
 
-    def _last_non_empty_line(self, lines: Sequence[str]) -> str:
-        """Return the most recent non-empty line if available."""
-
-        for line in reversed(lines):
-            if line:
-                return line
-        return ""
-
     def _should_merge_with_previous(self, previous: str, current: str) -> bool:
         """Return whether the current line should continue the previous one."""
 
         if previous.startswith("## ") or current.startswith("## "):
             return False
-        if previous.endswith(self.PARAGRAPH_TERMINATORS):
+        # ``previous`` is never empty here and every terminator is a single
+        # character, so a set lookup on the last character suffices.
+        if previous[-1] in _PARAGRAPH_TERMINATOR_CHARS:
             return False
         if previous[-1].isdigit():
             return False
@@ -381,8 +431,13 @@ class PdfCleaner(BaseCleaner):
         stripped = text.lstrip()
         if not stripped:
             return False
-        if stripped.startswith(self.BULLET_PREFIXES):
+        first = stripped[0]
+        if first in _BULLET_PREFIX_CHARS:
             return True
+        # BULLET_PATTERN can only match from a decimal digit or a roman
+        # numeral letter, so skip the regex for every other first character.
+        if not (first.isdecimal() or first in _ROMAN_NUMERAL_INITIALS):
+            return False
         return bool(self.BULLET_PATTERN.match(stripped))
 
     def _is_noise_line(self, text: str) -> bool:
@@ -391,20 +446,55 @@ class PdfCleaner(BaseCleaner):
         stripped = text.strip()
         if not stripped:
             return True
-        if self.NUMERIC_NOISE_PATTERN.fullmatch(stripped):
-            return True
-        if self.UPPER_LETTER_PATTERN.fullmatch(stripped):
-            return True
+        # Dispatch on the first character so ordinary lines never reach the
+        # regexes: numeric noise starts with an ASCII digit and the letter
+        # pattern is at most two characters long.
+        first = stripped[0]
+        if "0" <= first <= "9":
+            if stripped.isascii() and stripped.isdigit():
+                return True
+            return bool(self.NUMERIC_NOISE_PATTERN.fullmatch(stripped))
+        if len(stripped) <= 2:
+            return bool(self.UPPER_LETTER_PATTERN.fullmatch(stripped))
         return False
 
-    def _is_heading_line(self, line_words: Sequence[_Word], baseline_size: float) -> bool:
-        """Determine whether the provided line qualifies as a heading."""
+    def _heading_size_threshold(self, baseline_size: float) -> float:
+        """Return the font size from which words count as heading text."""
 
-        if not line_words:
-            return False
-        return any(
-            word.is_heading_candidate(baseline_size, self.HEADING_SIZE_MULTIPLIER)
-            for word in line_words
-        )
+        if baseline_size <= 0:
+            return float("inf")
+        return baseline_size * self.HEADING_SIZE_MULTIPLIER
+
+    def _is_heading_line(self, line_words: Sequence[_Word], heading_threshold: float) -> bool:
+        """Determine whether the provided line qualifies as a heading.
+
+        A line is a heading when any word is bold or reaches ``heading_threshold``.
+        Words never have empty text here; extraction drops blank words.
+        """
+
+        return any(word.bold or word.size >= heading_threshold for word in line_words)
 
     # TODO: future enhancement - incorporate embedded images or figures extraction.
+
+
+# Every terminator and bullet prefix is a single character, so membership of
+# the relevant character replaces ``str.endswith``/``startswith`` over tuples.
+_PARAGRAPH_TERMINATOR_CHARS = frozenset(PdfCleaner.PARAGRAPH_TERMINATORS)
+_BULLET_PREFIX_CHARS = frozenset(PdfCleaner.BULLET_PREFIXES)
+
+
+def _normalize_nfkc(text: str) -> str:
+    """Return ``text`` in NFKC form; pure-ASCII text is already normalised."""
+
+    # isascii() is a constant-time flag check, unlike the full NFKC scan.
+    return text if text.isascii() else unicodedata.normalize("NFKC", text)
+
+
+def _clean_page_range(task: tuple[type[PdfCleaner], str, int, int]) -> List[str]:
+    """Clean pages ``[start, stop)`` of a PDF; executed inside worker processes."""
+
+    cleaner_cls, file_path, start, stop = task
+    cleaner = cleaner_cls(max_workers=1)
+    with pdfplumber.open(file_path) as pdf:
+        pages = pdf.pages
+        return [cleaner._process_page(pages[index], index + 1) for index in range(start, stop)]
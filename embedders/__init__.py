@@ -1,5 +1,6 @@
 """Embedding client package."""
 
+from .embedding_cache import EmbeddingCache
 from .qwen_client import EmbeddingClient, EmbeddingClientError
 
-__all__ = ["EmbeddingClient", "EmbeddingClientError"]
+__all__ = ["EmbeddingCache", "EmbeddingClient", "EmbeddingClientError"]
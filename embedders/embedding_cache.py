@@ -0,0 +1,85 @@
+"""Content-addressed cache for embedding vectors."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Stay well below SQLite's host parameter limit when querying many keys.
+_MAX_QUERY_PARAMS = 500
+
+
+def embedding_cache_key(model: str, text: str) -> bytes:
+    """Return a stable cache key for ``text`` embedded by ``model``."""
+
+    return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).digest()
+
+
+@dataclass
+class EmbeddingCache:
+    """SQLite-backed store mapping content hashes to embedding vectors.
+
+    Vectors are stored as raw float64 bytes so cached embeddings are
+    returned exactly as the API produced them.
+
+    Parameters
+    ----------
+    path:
+        Database file used to persist vectors across runs. ``None`` keeps
+        the cache in memory for the lifetime of the process.
+    """
+
+    path: Optional[Path] = None
+    _connection: sqlite3.Connection = field(init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        database = str(self.path) if self.path is not None else ":memory:"
+        self._connection = sqlite3.connect(database, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._connection.commit()
+
+    def get_many(self, keys: Sequence[bytes]) -> Dict[bytes, List[float]]:
+        """Return the cached vectors for ``keys``; missing keys are omitted."""
+
+        found: Dict[bytes, List[float]] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        with self._lock:
+            for start in range(0, len(unique_keys), _MAX_QUERY_PARAMS):
+                batch = unique_keys[start : start + _MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    batch,
+                )
+                for key, blob in rows:
+                    found[bytes(key)] = array("d", blob).tolist()
+        return found
+
+    def set_many(self, items: Iterable[Tuple[bytes, Sequence[float]]]) -> None:
+        """Store ``(key, vector)`` pairs, keeping existing entries untouched."""
+
+        rows = [(key, array("d", vector).tobytes()) for key, vector in items]
+        if not rows:
+            return
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO embeddings (key, vector) VALUES (?, ?)",
+                rows,
+            )
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+
+        with self._lock:
+            self._connection.close()
@@ -5,84 +5,197 @@ from __future__ import annotations
 import json
 import logging
 import os
+import queue
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 import requests
 from requests import RequestException
-try:
-    from tenacity import (
-        RetryError,
-        retry,
-        stop_after_attempt,
-        wait_exponential,
-    )
-except ImportError:  # pragma: no cover - fallback when tenacity unavailable
-    class RetryError(Exception):
-        """Fallback retry error raised when retries are exhausted."""
+from requests.adapters import HTTPAdapter
 
-        def __init__(self, last_exception: Exception | None = None) -> None:
-            super().__init__("Retry attempts exhausted")
-            self.last_exception = last_exception
+from .embedding_cache import EmbeddingCache, embedding_cache_key
 
-    class _StopAfterAttempt:
-        def __init__(self, attempts: int) -> None:
-            self.attempts = max(1, attempts)
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the standard library
+    orjson = None
 
-    class _WaitExponential:
-        def __init__(self, **kwargs: int | float) -> None:
-            self.kwargs = kwargs
+LOGGER = logging.getLogger(__name__)
 
-    def stop_after_attempt(attempts: int) -> _StopAfterAttempt:
-        return _StopAfterAttempt(attempts)
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Attempts per request and the exponential backoff bounds between them.
+_MAX_ATTEMPTS = 3
+_RETRY_MIN_WAIT = 2.0
+_RETRY_MAX_WAIT = 10.0
+
+# Distinct hosts whose connection pools are kept: embedding and chat endpoints.
+_HTTP_POOL_HOSTS = 2
+
+_SECTION_PROMPT_PREFIX = (
+    "为以下文本块生成一个不超过10个字的简短总结作为高质量、概括性的section元数据，只能返回标题，不能包含其他内容："
+)
+
+# Embedding options shared by every embedding request.
+_EMBED_REQUEST_OPTIONS = {
+    "encoding_format": "float",
+    "dimensions": 1536,
+}
+
+# Chat completion options shared by every section title request.
+_SECTION_REQUEST_OPTIONS = {
+    "stream": False,
+    "max_tokens": 128,
+    "enable_thinking": True,
+    "thinking_budget": 512,
+    "min_p": 0.05,
+    "stop": None,
+    "temperature": 0.3,
+    "top_p": 0.7,
+    "top_k": 50,
+    "frequency_penalty": 0.5,
+    "n": 1,
+    "response_format": {"type": "text"},
+}
 
-    def wait_exponential(**kwargs: int | float) -> _WaitExponential:
-        return _WaitExponential(**kwargs)
 
-    def retry(*retry_args, **retry_kwargs):
-        stop = retry_kwargs.get("stop", _StopAfterAttempt(3))
-        attempts = getattr(stop, "attempts", 3)
+class EmbeddingClientError(RuntimeError):
+    """Raised when the embedding client cannot fulfil a request."""
 
-        def decorator(func):
-            def wrapper(*args, **kwargs):
-                last_exc: Exception | None = None
-                for attempt in range(attempts):
-                    try:
-                        return func(*args, **kwargs)
-                    except Exception as exc:  # noqa: BLE001 - mirror tenacity behaviour
-                        last_exc = exc
-                        if attempt == attempts - 1:
-                            raise RetryError(last_exc) from exc
-                raise RetryError(last_exc)
 
-            return wrapper
+def _dump_json_bytes(payload: dict) -> bytes:
+    """Serialise a request body, preferring ``orjson`` when it is installed."""
 
-        return decorator
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
 
-LOGGER = logging.getLogger(__name__)
 
+def _write_json_log(path: Path, record: dict) -> None:
+    """Write ``record`` to ``path`` as indented UTF-8 JSON."""
+
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(record, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    path.write_text(json.dumps(record, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+# Log files are written by one background thread so request threads never
+# block on serialisation or disk I/O between network calls.
+_LOG_QUEUE: "queue.Queue[Tuple[Path, dict]]" = queue.Queue()
+_LOG_WRITER_LOCK = threading.Lock()
+_log_writer: Optional[threading.Thread] = None
+
+
+def _drain_log_queue() -> None:
+    """Write queued log records forever; runs on the log writer thread."""
+
+    while True:
+        path, record = _LOG_QUEUE.get()
+        try:
+            _write_json_log(path, record)
+        except Exception as exc:  # noqa: BLE001 - the writer thread must outlive bad records
+            LOGGER.warning("Failed to write log file %s: %s", path, exc)
+        finally:
+            _LOG_QUEUE.task_done()
+
+
+def _enqueue_json_log(path: Path, record: dict) -> None:
+    """Queue ``record`` to be written to ``path`` by the log writer thread."""
+
+    global _log_writer
+    with _LOG_WRITER_LOCK:
+        if _log_writer is None:
+            _log_writer = threading.Thread(
+                target=_drain_log_queue,
+                name="embedding-log-writer",
+                daemon=True,
+            )
+            _log_writer.start()
+    _LOG_QUEUE.put((path, record))
+
+
+def _flush_json_logs() -> None:
+    """Block until every queued log record has been written."""
+
+    _LOG_QUEUE.join()
+
+
+def _reset_log_writer_after_fork() -> None:
+    """Give a forked child its own log queue; the parent's writer thread is not copied."""
+
+    global _LOG_QUEUE, _LOG_WRITER_LOCK, _log_writer
+    _LOG_QUEUE = queue.Queue()
+    _LOG_WRITER_LOCK = threading.Lock()
+    _log_writer = None
 
-class EmbeddingClientError(RuntimeError):
-    """Raised when the embedding client cannot fulfil a request."""
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch - unavailable on Windows
+    os.register_at_fork(after_in_child=_reset_log_writer_after_fork)
+
+
+def _decode_body(response: requests.Response) -> str:
+    """Decode an error response body once, as UTF-8 like the API sends it.
+
+    ``response.text`` re-runs charset detection on every access, so the
+    error paths decode ``response.content`` directly instead.
+    """
+
+    return response.content.decode("utf-8", errors="replace")
+
+
+def _load_json_bytes(content: bytes) -> dict:
+    """Decode a response body, preferring ``orjson`` when it is installed.
+
+    Both decoders raise :class:`json.JSONDecodeError` (or a subclass) on
+    malformed input.
+    """
+
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+@lru_cache(maxsize=8)
+def _read_config_api_key(path: str, mtime_ns: int) -> Optional[str]:
+    """Return the ``api_key`` stored in ``path``; ``mtime_ns`` invalidates stale entries."""
+
+    try:
+        payload = _load_json_bytes(Path(path).read_bytes())
+    except json.JSONDecodeError as exc:  # pragma: no cover - defensive
+        raise EmbeddingClientError(f"Invalid JSON in {path}") from exc
+    key = payload.get("api_key")
+    return key if isinstance(key, str) and key else None
 
 
 def _load_api_key(config_path: Optional[Path]) -> str:
-    """Load API key from environment variables or configuration file."""
+    """Load API key from environment variables or configuration file.
+
+    The configuration file is parsed once and shared by every client until
+    its modification time changes.
+    """
 
     api_key = os.environ.get("EMBEDDING_API_KEY")
     if api_key:
         return api_key
 
-    if config_path is not None and config_path.exists():
-        raw = config_path.read_text(encoding="utf-8")
+    if config_path is not None:
         try:
-            payload = json.loads(raw)
-        except json.JSONDecodeError as exc:  # pragma: no cover - defensive
-            raise EmbeddingClientError(f"Invalid JSON in {config_path}") from exc
-        key = payload.get("api_key")
-        if isinstance(key, str) and key:
-            return key
+            mtime_ns = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            pass
+        else:
+            key = _read_config_api_key(str(config_path), mtime_ns)
+            if key:
+                return key
 
     raise EmbeddingClientError(
         "Embedding API key not found. Set EMBEDDING_API_KEY or provide config file."
@@ -100,180 +213,265 @@ class EmbeddingClient:
     max_batch_size: int = 8
     log_payloads: bool = False
     log_dir: Optional[Path] = None
+    embed_concurrency: int = 4
+    cache: Optional[EmbeddingCache] = None
     _request_counter: int = field(default=0, init=False)
     section_base_url: str = "https://api.siliconflow.cn/v1/chat/completions"
     section_model: str = "Qwen/Qwen3-14B"
-    section_batch_size: int = 4
+    section_concurrency: int = 16
+    # Deprecated alias of ``section_concurrency`` kept for existing callers.
+    section_batch_size: Optional[int] = field(default=None, repr=False)
     _section_request_counter: int = field(default=0, init=False)
+    _counter_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    _session: requests.Session = field(init=False, repr=False)
+    _executors: Dict[str, ThreadPoolExecutor] = field(default_factory=dict, init=False, repr=False)
 
     def __post_init__(self) -> None:
         if not self.api_key:
             raise EmbeddingClientError("API key must not be empty.")
         if self.max_batch_size <= 0:
             raise ValueError("max_batch_size must be positive.")
+        if self.embed_concurrency <= 0:
+            raise ValueError("embed_concurrency must be positive.")
+        if self.section_batch_size is not None:
+            warnings.warn(
+                "section_batch_size is deprecated; use section_concurrency instead.",
+                DeprecationWarning,
+                stacklevel=3,
+            )
+            self.section_concurrency = self.section_batch_size
+        if self.section_concurrency <= 0:
+            raise ValueError("section_concurrency must be positive.")
+        self._session = self._build_session(
+            self.api_key,
+            pool_size=self.embed_concurrency + self.section_concurrency,
+        )
+
+    @staticmethod
+    def _build_session(api_key: str, pool_size: int) -> requests.Session:
+        """Create a keep-alive session so TLS connections are reused across calls.
+
+        Each host keeps up to ``pool_size`` idle connections, enough for every
+        embedding and section worker to hold one at the same time without the
+        pool discarding sockets. Authentication and content-type headers are
+        attached once here rather than rebuilt for every request. Compressed
+        responses are requested explicitly; ``requests`` decodes them
+        transparently.
+        """
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_HTTP_POOL_HOSTS, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(
+            {
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+            }
+        )
+        return session
+
+    def close(self) -> None:
+        """Release pooled HTTP connections and request worker threads."""
+
+        with self._counter_lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=True)
+        self._session.close()
 
     def embed(self, texts: Iterable[str]) -> List[List[float]]:
-        """Return embeddings for the provided texts."""
+        """Return embeddings for the provided texts.
+
+        Batches are sent concurrently, with at most ``embed_concurrency`` in
+        flight, and the embeddings are returned in input order. When ``cache``
+        is configured, only texts without a cached vector reach the API.
+        """
 
-        batches = self._chunk_texts(list(texts), self.max_batch_size)
+        text_list = list(texts)
+        if self.cache is None:
+            return self._embed_uncached(text_list)
+
+        keys = [embedding_cache_key(self.model, text) for text in text_list]
+        cached = self.cache.get_many(keys)
+        missing = [index for index, key in enumerate(keys) if key not in cached]
+        if missing:
+            fetched = self._embed_uncached([text_list[index] for index in missing])
+            self.cache.set_many((keys[index], fetched[pos]) for pos, index in enumerate(missing))
+            for pos, index in enumerate(missing):
+                cached[keys[index]] = fetched[pos]
+        return [cached[key] for key in keys]
+
+    def _embed_uncached(self, texts: List[str]) -> List[List[float]]:
+        """Embed ``texts`` through the API in concurrent batches.
+
+        Repeated strings are sent once and their vector is scattered back to
+        every position they occupy.
+        """
+
+        unique_texts = list(dict.fromkeys(texts))
+        batches = self._chunk_texts(unique_texts, self.max_batch_size)
         self._request_counter = 0
         embeddings: List[List[float]] = []
-        for batch in batches:
-            embeddings.extend(self._embed_batch(batch))
-        return embeddings
+        try:
+            for batch_embeddings in self._run_concurrently(
+                self._embed_batch, batches, "embedding", self.embed_concurrency
+            ):
+                embeddings.extend(batch_embeddings)
+        finally:
+            if self.log_dir is not None:
+                _flush_json_logs()
+        if len(unique_texts) == len(texts):
+            return embeddings
+        by_text = dict(zip(unique_texts, embeddings))
+        return [list(by_text[text]) for text in texts]
 
     def generate_section_titles(self, texts: Iterable[str]) -> List[str]:
-        """Generate short section titles for ``texts`` using chat completions."""
+        """Generate short section titles for ``texts`` using chat completions.
+
+        Requests are issued concurrently, with at most ``section_concurrency``
+        in flight, so wall time approaches the slowest call instead of the
+        sum of all calls. Titles are returned in input order; a text whose
+        request still fails after retries gets an empty title without
+        discarding the others.
+        """
 
         text_list = list(texts)
         if not text_list:
             return []
 
-        results: List[str] = []
         self._section_request_counter = 0
-        for batch in self._chunk_texts(text_list, self.section_batch_size):
-            batch_results: List[str] = []
-            for text in batch:
-                try:
-                    batch_results.append(self._call_section_api(text))
-                except RetryError as exc:
-                    raise EmbeddingClientError("Section title generation failed after retries") from exc
-            results.extend(batch_results)
-        return results
-
-    def _chunk_texts(self, texts: List[str], size: int) -> List[List[str]]:
-        """Split ``texts`` into batches of ``size``."""
-
-        return [texts[i : i + size] for i in range(0, len(texts), size)]
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=False,
-    )
+        try:
+            return self._run_concurrently(
+                self._generate_section_title, text_list, "section", self.section_concurrency
+            )
+        finally:
+            if self.log_dir is not None:
+                _flush_json_logs()
+
+    def _run_concurrently(
+        self,
+        func: Callable[[_T], _R],
+        items: Iterable[_T],
+        pool: str,
+        limit: int,
+    ) -> List[_R]:
+        """Apply ``func`` to ``items`` on the ``pool`` executor preserving order.
+
+        Each pool is created once per client with ``limit`` workers and reused
+        by later calls, so the cap also holds across concurrent callers.
+        ``items`` is consumed lazily as work is submitted.
+        """
+
+        iterator = iter(items)
+        head = list(islice(iterator, 2))
+        if len(head) <= 1:
+            return [func(item) for item in head]
+
+        with self._counter_lock:
+            executor = self._executors.get(pool)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=limit, thread_name_prefix=f"{pool}-request")
+                self._executors[pool] = executor
+
+        futures = [executor.submit(func, item) for item in chain(head, iterator)]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    def _chunk_texts(self, texts: List[str], size: int) -> Iterator[List[str]]:
+        """Yield successive batches of ``size`` from ``texts``."""
+
+        for i in range(0, len(texts), size):
+            yield texts[i : i + size]
+
     def _call_api(self, batch: List[str]) -> List[List[float]]:
         """Call the embedding API and return the embeddings."""
 
-        payload = {
-            "model": self.model,
-            "input": batch,
-            "encoding_format": "float",
-            "dimensions": 1536,
-        }
+        payload = {"model": self.model, "input": batch, **_EMBED_REQUEST_OPTIONS}
         if self.log_payloads:
             LOGGER.debug("Embedding request payload: %s", payload)
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        log_dir = self.log_dir
+        if log_dir is None:
+            return self._send_embedding_request(payload, len(batch), None)
 
-        sequence_id = self._request_counter
-        prefix = None
-        if self.log_dir is not None:
-            self.log_dir.mkdir(parents=True, exist_ok=True)
-            prefix = f"{sequence_id:04d}"
-            request_path = self.log_dir / f"{prefix}_request.json"
-            request_path.write_text(
-                json.dumps({"payload": payload}, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
+        with self._counter_lock:
+            sequence_id = self._request_counter
+            self._request_counter += 1
+        log_dir.mkdir(parents=True, exist_ok=True)
+        log_record = {"payload": payload}
+        try:
+            return self._send_embedding_request(payload, len(batch), log_record)
+        finally:
+            _enqueue_json_log(log_dir / f"{sequence_id:04d}.json", log_record)
+
+    def _send_embedding_request(
+        self,
+        payload: dict,
+        expected: int,
+        log_record: Optional[dict],
+    ) -> List[List[float]]:
+        """POST ``payload`` and parse the embeddings, noting the outcome in ``log_record``."""
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.base_url,
-                headers=headers,
-                json=payload,
+                data=_dump_json_bytes(payload),
                 timeout=self.request_timeout,
             )
         except RequestException as exc:
-            if prefix and self.log_dir is not None:
-                error_path = self.log_dir / f"{prefix}_network_error.json"
-                error_path.write_text(
-                    json.dumps(
-                        {
-                            "error": str(exc),
-                        },
-                        ensure_ascii=False,
-                        indent=2,
-                    ),
-                    encoding="utf-8",
-                )
-            self._request_counter += 1
+            if log_record is not None:
+                log_record["error"] = str(exc)
             raise
 
-        self._request_counter += 1
-
         if response.status_code != 200:
+            body = _decode_body(response)
             LOGGER.warning(
                 "Embedding API responded with %s: %s",
                 response.status_code,
-                response.text,
+                body,
             )
-            if prefix and self.log_dir is not None:
-                error_path = self.log_dir / f"{prefix}_status_error.json"
-                error_path.write_text(
-                    json.dumps(
-                        {
-                            "status_code": response.status_code,
-                            "text": response.text,
-                        },
-                        ensure_ascii=False,
-                        indent=2,
-                    ),
-                    encoding="utf-8",
-                )
+            if log_record is not None:
+                log_record.update(status_code=response.status_code, text=body)
             raise EmbeddingClientError(
-                f"Embedding API error: {response.status_code} {response.text}"
+                f"Embedding API error: {response.status_code} {body}"
             )
 
+        LOGGER.debug(
+            "Embedding response Content-Encoding: %s",
+            response.headers.get("Content-Encoding"),
+        )
         try:
-            data = response.json()
+            data = _load_json_bytes(response.content)
         except json.JSONDecodeError as exc:
-            LOGGER.error("Unable to decode embedding response: %s", response.text)
-            if prefix and self.log_dir is not None:
-                error_path = self.log_dir / f"{prefix}_response_error.json"
-                error_path.write_text(
-                    json.dumps(
-                        {
-                            "text": response.text,
-                            "error": str(exc),
-                        },
-                        ensure_ascii=False,
-                        indent=2,
-                    ),
-                    encoding="utf-8",
-                )
+            body = _decode_body(response)
+            LOGGER.error("Unable to decode embedding response: %s", body)
+            if log_record is not None:
+                log_record.update(text=body, error=str(exc))
             raise EmbeddingClientError("Invalid JSON response from embedding API") from exc
 
+        if log_record is not None:
+            log_record["response"] = data
+
         embeddings = self._parse_embeddings(data)
-        if len(embeddings) != len(batch):
+        if len(embeddings) != expected:
             raise EmbeddingClientError(
-                f"Embedding count mismatch: expected {len(batch)}, got {len(embeddings)}"
-            )
-
-        if prefix and self.log_dir is not None:
-            response_path = self.log_dir / f"{prefix}_response.json"
-            response_path.write_text(
-                json.dumps(
-                    {
-                        "response": data,
-                    },
-                    ensure_ascii=False,
-                    indent=2,
-                ),
-                encoding="utf-8",
+                f"Embedding count mismatch: expected {expected}, got {len(embeddings)}"
             )
-
         return embeddings
 
     def _embed_batch(self, batch: List[str]) -> List[List[float]]:
-        """Wrapper handling retry exceptions."""
+        """Embed ``batch`` retrying transient failures."""
 
-        try:
-            return self._call_api(batch)
-        except RetryError as exc:
-            raise EmbeddingClientError("Embedding API call failed after retries") from exc
+        return self._with_retries(self._call_api, batch, "Embedding API call")
 
     @staticmethod
     def _parse_embeddings(payload: dict) -> List[List[float]]:
@@ -288,14 +486,42 @@ class EmbeddingClient:
             embedding = item.get("embedding")
             if not isinstance(embedding, list):
                 raise EmbeddingClientError("Embedding vector missing in response item.")
-            embeddings.append([float(value) for value in embedding])
+            # ``map`` runs the float coercion loop in C.
+            embeddings.append(list(map(float, embedding)))
         return embeddings
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    def _generate_section_title(self, text: str) -> str:
+        """Generate a title for ``text`` retrying transient failures.
+
+        Returns an empty string when every attempt fails, so one bad text
+        only falls back on its own title.
+        """
+
+        try:
+            return self._with_retries(self._call_section_api, text, "Section title generation")
+        except EmbeddingClientError as exc:
+            LOGGER.warning("Section title generation failed: %s", exc)
+            return ""
+
+    @staticmethod
+    def _with_retries(func: Callable[[_T], _R], arg: _T, description: str) -> _R:
+        """Call ``func(arg)`` up to ``_MAX_ATTEMPTS`` times with exponential backoff.
+
+        The backoff only runs after a failure, so successful calls pay for a
+        single ``try`` block. The last error is chained onto the raised
+        :class:`EmbeddingClientError`.
+        """
+
+        last_exc: Exception | None = None
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                return func(arg)
+            except Exception as exc:  # noqa: BLE001 - every failure is retried
+                last_exc = exc
+                if attempt + 1 < _MAX_ATTEMPTS:
+                    time.sleep(min(_RETRY_MAX_WAIT, max(_RETRY_MIN_WAIT, 2.0**attempt)))
+        raise EmbeddingClientError(f"{description} failed after retries") from last_exc
+
     def _call_section_api(self, text: str) -> str:
         """Call chat completion API to generate a section title."""
 
@@ -304,107 +530,58 @@ class EmbeddingClient:
             "messages": [
                 {
                     "role": "user",
-                    "content": (
-                        "为以下文本块生成一个不超过10个字的简短总结作为高质量、概括性的section元数据，只能返回标题，不能包含其他内容："
-                        f"{text}"
-                    ),
+                    "content": _SECTION_PROMPT_PREFIX + text,
                 }
             ],
-            "stream": False,
-            "max_tokens": 128,
-            "enable_thinking": True,
-            "thinking_budget": 512,
-            "min_p": 0.05,
-            "stop": None,
-            "temperature": 0.3,
-            "top_p": 0.7,
-            "top_k": 50,
-            "frequency_penalty": 0.5,
-            "n": 1,
-            "response_format": {"type": "text"},
+            **_SECTION_REQUEST_OPTIONS,
         }
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        log_dir = self.log_dir
+        if log_dir is None:
+            return self._send_section_request(payload, None)
 
-        sequence_id = self._section_request_counter
-        prefix = None
-        if self.log_dir is not None:
-            self.log_dir.mkdir(parents=True, exist_ok=True)
-            prefix = f"section_{sequence_id:04d}"
-            request_path = self.log_dir / f"{prefix}_request.json"
-            request_path.write_text(
-                json.dumps({"payload": payload}, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
+        with self._counter_lock:
+            sequence_id = self._section_request_counter
+            self._section_request_counter += 1
+        log_dir.mkdir(parents=True, exist_ok=True)
+        log_record = {"payload": payload}
+        try:
+            return self._send_section_request(payload, log_record)
+        finally:
+            _enqueue_json_log(log_dir / f"section_{sequence_id:04d}.json", log_record)
+
+    def _send_section_request(self, payload: dict, log_record: Optional[dict]) -> str:
+        """POST ``payload`` and parse the title, noting the outcome in ``log_record``."""
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.section_base_url,
-                headers=headers,
-                json=payload,
+                data=_dump_json_bytes(payload),
                 timeout=self.request_timeout,
             )
         except RequestException as exc:
-            if prefix and self.log_dir is not None:
-                error_path = self.log_dir / f"{prefix}_network_error.json"
-                error_path.write_text(
-                    json.dumps({"error": str(exc)}, ensure_ascii=False, indent=2),
-                    encoding="utf-8",
-                )
-            self._section_request_counter += 1
+            if log_record is not None:
+                log_record["error"] = str(exc)
             raise
 
-        self._section_request_counter += 1
-
         if response.status_code != 200:
-            if prefix and self.log_dir is not None:
-                error_path = self.log_dir / f"{prefix}_status_error.json"
-                error_path.write_text(
-                    json.dumps(
-                        {
-                            "status_code": response.status_code,
-                            "text": response.text,
-                        },
-                        ensure_ascii=False,
-                        indent=2,
-                    ),
-                    encoding="utf-8",
-                )
+            body = _decode_body(response)
+            if log_record is not None:
+                log_record.update(status_code=response.status_code, text=body)
             raise EmbeddingClientError(
-                f"Section API error: {response.status_code} {response.text}"
+                f"Section API error: {response.status_code} {body}"
             )
 
         try:
-            data = response.json()
+            data = _load_json_bytes(response.content)
         except json.JSONDecodeError as exc:
-            if prefix and self.log_dir is not None:
-                error_path = self.log_dir / f"{prefix}_response_error.json"
-                error_path.write_text(
-                    json.dumps(
-                        {
-                            "text": response.text,
-                            "error": str(exc),
-                        },
-                        ensure_ascii=False,
-                        indent=2,
-                    ),
-                    encoding="utf-8",
-                )
+            if log_record is not None:
+                log_record.update(text=_decode_body(response), error=str(exc))
             raise EmbeddingClientError("Invalid section response JSON") from exc
 
-        title = self._parse_section_title(data)
-
-        if prefix and self.log_dir is not None:
-            response_path = self.log_dir / f"{prefix}_response.json"
-            response_path.write_text(
-                json.dumps({"response": data}, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
-
-        return title
+        if log_record is not None:
+            log_record["response"] = data
+        return self._parse_section_title(data)
 
     @staticmethod
     def _parse_section_title(payload: dict) -> str:
@@ -4,22 +4,36 @@ from __future__ import annotations
 
 import json
 import logging
+from array import array
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import chain, islice
 from pathlib import Path
 from time import perf_counter
-from typing import Iterable, List, Sequence
+from typing import Deque, Iterable, Iterator, List, Tuple
 
 from embedders import EmbeddingClient, EmbeddingClientError
 from storages import PostgresWriter, PostgresWriterError
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the standard library
+    orjson = None
+
 LOGGER = logging.getLogger(__name__)
 
 
-def chunk_iterable(items: Sequence[dict], batch_size: int) -> Iterable[List[dict]]:
-    """Yield batches from ``items`` of size ``batch_size``."""
+def chunk_iterable(items: Iterable[dict], batch_size: int) -> Iterable[List[dict]]:
+    """Yield batches from ``items`` of size ``batch_size``.
+
+    ``items`` may be any iterable, so batches can be produced while the
+    source is still being read.
+    """
 
-    for idx in range(0, len(items), batch_size):
-        yield list(items[idx : idx + batch_size])
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
 
 
 @dataclass
@@ -30,32 +44,35 @@ class EmbeddingLoader:
     postgres_writer: PostgresWriter = field(default_factory=PostgresWriter)
     batch_size: int = 16
     dead_letter_dir: Path = Path("data/dead_letters")
+    max_workers: int = 4
 
     def run(self, jsonl_path: Path) -> None:
         """Execute the embedding and load pipeline for ``jsonl_path``."""
 
         start_time = perf_counter()
-        chunks = self._read_chunks(jsonl_path)
-        if not chunks:
+        chunk_stream = self._iter_chunks(jsonl_path)
+        first_chunk = next(chunk_stream, None)
+        if first_chunk is None:
             LOGGER.warning("No chunks found in %s", jsonl_path)
             return
 
-        document_id = chunks[0].get("document_id", "unknown")
+        document_id = first_chunk.get("document_id", "unknown")
         success_chunks: List[dict] = []
         failed_count = 0
-
-        for batch in chunk_iterable(chunks, self.batch_size):
-            try:
-                embeddings = self.embedding_client.embed([chunk["content"] for chunk in batch])
-            except EmbeddingClientError as exc:
-                failed_count += len(batch)
-                LOGGER.error("Embedding failed for document %s batch of size %s: %s", document_id, len(batch), exc)
-                self._write_dead_letters(document_id, batch, str(exc))
-                continue
-
-            for chunk, embedding in zip(batch, embeddings):
-                chunk["embedding"] = embedding
-            success_chunks.extend(batch)
+        total_count = 0
+
+        # Batches are submitted while the file is still being read and are
+        # collected in batch order so upserts and dead letters stay
+        # deterministic; at most ``max_workers`` batches wait in flight.
+        pending: Deque[Tuple[List[dict], Future]] = deque()
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            for batch in chunk_iterable(chain([first_chunk], chunk_stream), self.batch_size):
+                total_count += len(batch)
+                pending.append((batch, executor.submit(self._embed_batch, batch)))
+                if len(pending) > self.max_workers:
+                    failed_count += self._collect_batch(document_id, *pending.popleft(), success_chunks)
+            while pending:
+                failed_count += self._collect_batch(document_id, *pending.popleft(), success_chunks)
 
         if success_chunks:
             try:
@@ -71,17 +88,50 @@ class EmbeddingLoader:
         LOGGER.info(
             "Loader finished for %s; total=%s, success=%s, failed=%s, elapsed=%.2fs",
             document_id,
-            len(chunks),
+            total_count,
             len(success_chunks),
             failed_count,
             elapsed,
         )
 
-    def _read_chunks(self, jsonl_path: Path) -> List[dict]:
-        """Read JSONL chunks from disk."""
-
-        with jsonl_path.open("r", encoding="utf-8") as handle:
-            return [json.loads(line) for line in handle if line.strip()]
+    def _collect_batch(
+        self,
+        document_id: str,
+        batch: List[dict],
+        future: Future,
+        success_chunks: List[dict],
+    ) -> int:
+        """Attach embeddings from ``future`` to ``batch`` and return the failed count."""
+
+        embeddings, error = future.result()
+        if error is not None:
+            LOGGER.error("Embedding failed for document %s batch of size %s: %s", document_id, len(batch), error)
+            self._write_dead_letters(document_id, batch, str(error))
+            return len(batch)
+
+        # Packed float64 arrays hold the vectors until the database write at
+        # a fraction of the memory of lists of floats.
+        for chunk, embedding in zip(batch, embeddings):
+            chunk["embedding"] = array("d", embedding)
+        success_chunks.extend(batch)
+        return 0
+
+    def _embed_batch(self, batch: List[dict]) -> Tuple[List[List[float]], EmbeddingClientError | None]:
+        """Embed ``batch`` returning either the vectors or the client error."""
+
+        try:
+            return self.embedding_client.embed([chunk["content"] for chunk in batch]), None
+        except EmbeddingClientError as exc:
+            return [], exc
+
+    def _iter_chunks(self, jsonl_path: Path) -> Iterator[dict]:
+        """Stream JSONL chunks from disk one line at a time."""
+
+        loads = orjson.loads if orjson is not None else json.loads
+        with jsonl_path.open("rb") as handle:
+            for line in handle:
+                if line.strip():
+                    yield loads(line)
 
     def _write_dead_letters(self, document_id: str, batch: List[dict], reason: str) -> None:
         """Append failed batch contents to dead letter file."""
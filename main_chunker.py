@@ -10,6 +10,11 @@ from typing import Dict, List, Optional
 
 from chunkers.pipeline import Chunker
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the standard library
+    orjson = None
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -67,10 +72,13 @@ def read_text(path: Path) -> str:
 def write_chunks(chunks: List[Dict[str, object]], output_path: Path) -> None:
     """Persist chunk dictionaries to a JSONL file."""
 
-    with output_path.open("w", encoding="utf-8") as handle:
+    with output_path.open("wb") as handle:
         for chunk in chunks:
-            handle.write(json.dumps(chunk, ensure_ascii=False))
-            handle.write("\n")
+            if orjson is not None:
+                handle.write(orjson.dumps(chunk))
+            else:
+                handle.write(json.dumps(chunk, ensure_ascii=False).encode("utf-8"))
+            handle.write(b"\n")
 
 
 def chunk_file(
@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Type
+from typing import Dict, List, Optional, Sequence, Type
 
 from cleaners import BaseCleaner, HTMLCleaner, MarkdownCleaner, PdfCleaner
+from cleaners.cache import clean_cache_path, write_clean_cache
 
 LOGGER = logging.getLogger(__name__)
 
@@ -33,12 +37,15 @@ def build_dispatch_table() -> Dict[str, Type[BaseCleaner]]:
     }
 
 
+# Built once at import; resolve_cleaner only performs a lookup per file.
+_DISPATCH_TABLE: Dict[str, Type[BaseCleaner]] = build_dispatch_table()
+
+
 def resolve_cleaner(file_path: Path) -> BaseCleaner:
     """Instantiate the cleaner that should process the provided path."""
 
-    dispatch_table = build_dispatch_table()
     extension = file_path.suffix.lower()
-    cleaner_cls = dispatch_table.get(extension)
+    cleaner_cls = _DISPATCH_TABLE.get(extension)
     if cleaner_cls is None:
         msg = f"Unsupported file extension: {extension or '<none>'}"
         raise ValueError(msg)
@@ -51,33 +58,167 @@ def write_output(document_id: str, content: str) -> Path:
     output_dir = Path("data/clean")
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / f"{document_id}.txt"
-    output_path.write_text(content, encoding="utf-8")
+    output_path.write_bytes(content.encode("utf-8"))
     return output_path
 
 
-def clean_file(file_path: Path) -> Path:
-    """Execute the cleaning workflow for the provided file path."""
+def clean_file(
+    file_path: Path,
+    cleaners: Optional[Dict[str, BaseCleaner]] = None,
+    cache_dir: Optional[Path] = None,
+) -> Path:
+    """Execute the cleaning workflow for the provided file path.
+
+    Parameters
+    ----------
+    file_path:
+        Document that should be cleaned.
+    cleaners:
+        Optional mapping from file extension to cleaner instance. Missing
+        entries are created and stored so later files with the same
+        extension reuse them.
+    cache_dir:
+        Optional directory of cleaned outputs keyed by input content and
+        cleaner code. When an entry exists the document is not cleaned again.
+    """
 
     LOGGER.info("Processing file %s", file_path)
     if not file_path.exists():
         msg = f"File not found: {file_path}"
         raise FileNotFoundError(msg)
-    cleaner = resolve_cleaner(file_path)
+
+    # The key only needs the cleaner class, so a cache hit never builds one.
+    cleaner_cls = _DISPATCH_TABLE.get(file_path.suffix.lower())
+    cached_path: Optional[Path] = None
+    if cache_dir is not None and cleaner_cls is not None:
+        cached_path = clean_cache_path(file_path, cleaner_cls, cache_dir)
+    if cached_path is not None and cached_path.exists():
+        LOGGER.info("Reusing cleaned output for %s from %s", file_path, cached_path)
+        return write_output(file_path.stem, cached_path.read_text(encoding="utf-8"))
+
+    if cleaners is None:
+        cleaner = resolve_cleaner(file_path)
+    else:
+        extension = file_path.suffix.lower()
+        cleaner = cleaners.get(extension)
+        if cleaner is None:
+            cleaner = cleaners[extension] = resolve_cleaner(file_path)
     cleaned_content = cleaner.clean(str(file_path))
+    if cached_path is not None:
+        write_clean_cache(cached_path, cleaned_content.encode("utf-8"))
     output_path = write_output(file_path.stem, cleaned_content)
     LOGGER.info("Successfully cleaned file %s", file_path)
     return output_path
 
 
+# Cleaner instances shared by every file a worker process handles. Files are
+# already spread across processes, so PDFs are cleaned serially page by page
+# rather than each worker starting its own nested page pool.
+_WORKER_CLEANERS: Dict[str, BaseCleaner] = {".pdf": PdfCleaner(max_workers=1)}
+
+
+def _clean_file_in_worker(file_path: Path, cache_dir: Optional[Path] = None) -> Path:
+    """Clean ``file_path`` reusing this process's cleaner instances."""
+
+    return clean_file(file_path, _WORKER_CLEANERS, cache_dir)
+
+
+def clean_files(
+    paths: Sequence[Path],
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+) -> List[Path]:
+    """Clean ``paths`` in one batch, reusing one cleaner per file extension.
+
+    Parameters
+    ----------
+    paths:
+        Documents that should be cleaned. Outputs are returned in this order.
+    max_workers:
+        Number of worker processes. Defaults to ``os.cpu_count()``; a single
+        worker cleans the files in the current process.
+    cache_dir:
+        Optional content-addressed cache of cleaned outputs, see
+        :func:`clean_file`.
+    """
+
+    workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        cleaners: Dict[str, BaseCleaner] = {}
+        return [clean_file(path, cleaners, cache_dir) for path in paths]
+
+    LOGGER.info("Cleaning %s files with %s processes", len(paths), workers)
+    worker = partial(_clean_file_in_worker, cache_dir=cache_dir)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(worker, paths, chunksize=4))
+
+
+def clean_directory(
+    input_dir: Path,
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+) -> List[Path]:
+    """Clean every supported document in ``input_dir`` using worker processes.
+
+    Parameters
+    ----------
+    input_dir:
+        Directory whose files with a known extension should be cleaned.
+        Subdirectories and unsupported files are skipped. Outputs are named
+        by file stem, so two files sharing a stem raise ``ValueError``
+        before anything is cleaned.
+    max_workers:
+        Number of worker processes, as for :func:`clean_files`.
+    cache_dir:
+        Optional content-addressed cache of cleaned outputs, see
+        :func:`clean_file`.
+    """
+
+    if not input_dir.is_dir():
+        msg = f"Input directory not found: {input_dir}"
+        raise FileNotFoundError(msg)
+
+    paths = sorted(
+        path
+        for path in input_dir.iterdir()
+        if path.is_file() and path.suffix.lower() in _DISPATCH_TABLE
+    )
+    by_stem: Dict[str, Path] = {}
+    for path in paths:
+        other = by_stem.setdefault(path.stem, path)
+        if other is not path:
+            msg = f"Files {other.name} and {path.name} would both be cleaned to {path.stem}.txt"
+            raise ValueError(msg)
+    return clean_files(paths, max_workers=max_workers, cache_dir=cache_dir)
+
+
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
 
     parser = argparse.ArgumentParser(description="Clean documents into plain text.")
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "--input-file",
-        required=True,
         help="Path to the input document that should be cleaned.",
     )
+    source.add_argument(
+        "--input-files",
+        nargs="+",
+        help="Several documents to clean in one run, sharing cleaner instances.",
+    )
+    source.add_argument(
+        "--input-dir",
+        help="Directory whose supported documents should be cleaned in parallel.",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        help="Worker processes used with --input-files/--input-dir. Defaults to the CPU count.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Optional directory caching cleaned outputs by input content hash.",
+    )
     return parser.parse_args()
 
 
@@ -86,18 +227,34 @@ def main() -> None:
 
     configure_logging()
     args = parse_args()
-    input_path = Path(args.input_file)
+    cache_dir = Path(args.cache_dir) if args.cache_dir else None
+    source = ", ".join(args.input_files) if args.input_files else args.input_file or args.input_dir
     try:
-        output_path = clean_file(input_path)
-        LOGGER.info("Output written to %s", output_path)
+        if args.input_files:
+            output_paths = clean_files(
+                [Path(path) for path in args.input_files],
+                max_workers=args.max_workers,
+                cache_dir=cache_dir,
+            )
+            LOGGER.info("Cleaned %s files", len(output_paths))
+        elif args.input_dir:
+            output_paths = clean_directory(
+                Path(args.input_dir),
+                max_workers=args.max_workers,
+                cache_dir=cache_dir,
+            )
+            LOGGER.info("Cleaned %s files from %s", len(output_paths), args.input_dir)
+        else:
+            output_path = clean_file(Path(args.input_file), cache_dir=cache_dir)
+            LOGGER.info("Output written to %s", output_path)
     except FileNotFoundError:
-        LOGGER.exception("Input file does not exist: %s", input_path)
+        LOGGER.exception("Input file does not exist: %s", source)
         raise SystemExit(1) from None
     except ValueError:
-        LOGGER.exception("No cleaner configured for file: %s", input_path)
+        LOGGER.exception("No cleaner configured for file: %s", source)
         raise SystemExit(2) from None
     except Exception:  # noqa: BLE001
-        LOGGER.exception("Unexpected error while cleaning file: %s", input_path)
+        LOGGER.exception("Unexpected error while cleaning file: %s", source)
         raise SystemExit(3) from None
 
 
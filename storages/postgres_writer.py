@@ -2,39 +2,76 @@
 
 from __future__ import annotations
 
+import io
 import json
 import logging
 import os
+import threading
+from array import array
 from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
 
-import psycopg2
 from psycopg2 import sql
 from psycopg2.extensions import connection as PgConnection
-from psycopg2.extras import Json
+from psycopg2.extensions import cursor as PgCursor
+from psycopg2.extras import Json, execute_values
+from psycopg2.pool import ThreadedConnectionPool
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the standard library
+    orjson = None
 
 LOGGER = logging.getLogger(__name__)
 
 
+# Chunks are written in batches of this size: documents with fewer chunks
+# go out as a single multi-row INSERT, larger ones are streamed with COPY.
+_COPY_MIN_ROWS = 1000
+
+# Characters that must be backslash-escaped in COPY text format.
+_COPY_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+
 class PostgresWriterError(RuntimeError):
     """Raised when the writer fails to complete an operation."""
 
 
+@lru_cache(maxsize=8)
+def _read_config_file(path: str, mtime_ns: int) -> Dict[str, object]:
+    """Parse the JSON config at ``path``; ``mtime_ns`` invalidates stale entries."""
+
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
 def _load_dsn(config_path: Optional[Path]) -> Dict[str, object]:
-    """Load database configuration."""
+    """Load database configuration.
+
+    Environment variables are read on every call and take precedence. The
+    configuration file is parsed once and shared by every writer until its
+    modification time changes.
+    """
 
     dsn = os.environ.get("POSTGRES_DSN")
     table = os.environ.get("POSTGRES_TABLE")
     vector_dim = os.environ.get("POSTGRES_VECTOR_DIMENSION")
 
-    if config_path and config_path.exists():
-        raw = config_path.read_text(encoding="utf-8")
-        payload = json.loads(raw)
-        dsn = dsn or payload.get("dsn")
-        table = table or payload.get("table")
-        vector_dim = vector_dim or payload.get("vector_dimension")
+    if config_path:
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            pass
+        else:
+            payload = _read_config_file(str(config_path), mtime_ns)
+            dsn = dsn or payload.get("dsn")
+            table = table or payload.get("table")
+            vector_dim = vector_dim or payload.get("vector_dimension")
 
     if not dsn:
         raise PostgresWriterError("Postgres DSN not configured.")
@@ -55,12 +92,33 @@ def _load_dsn(config_path: Optional[Path]) -> Dict[str, object]:
 
 @dataclass
 class PostgresWriter:
-    """Writer handling transactional upsert into a pgvector table."""
+    """Writer handling transactional upsert into a pgvector table.
+
+    Connections are opened on first use and kept in a pool, so consecutive
+    operations reuse them instead of reconnecting. Call :meth:`close` to
+    release them.
+
+    Parameters
+    ----------
+    config_path:
+        JSON file providing ``dsn``, ``table`` and ``vector_dimension``;
+        environment variables take precedence.
+    max_connections:
+        Upper bound on simultaneously open connections.
+    """
 
     config_path: Path = Path("configs/postgres.json")
+    max_connections: int = 4
     dsn: str = field(init=False)
     table: str = field(init=False)
     vector_dimension: int = field(init=False)
+    _pool: Optional[ThreadedConnectionPool] = field(default=None, init=False, repr=False)
+    _pool_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _delete_sql: sql.Composed = field(init=False, repr=False)
+    _insert_sql: sql.Composed = field(init=False, repr=False)
+    _copy_sql: sql.Composed = field(init=False, repr=False)
+    _count_sql: sql.Composed = field(init=False, repr=False)
+    _sample_sql: sql.Composed = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         config = _load_dsn(self.config_path)
@@ -68,128 +126,208 @@ class PostgresWriter:
         self.table = config["table"]
         self.vector_dimension = config["vector_dim"]
 
+        # The table is fixed for the writer's lifetime, so every statement is
+        # composed once here instead of on each call.
+        table = sql.Identifier(self.table)
+        self._delete_sql = sql.SQL("DELETE FROM {table} WHERE document_id = %s").format(table=table)
+        self._insert_sql = sql.SQL(
+            """
+            INSERT INTO {table}
+                (chunk_id, document_id, content, embedding, metadata)
+            VALUES %s
+            """
+        ).format(table=table)
+        self._copy_sql = sql.SQL(
+            """
+            COPY {table} (chunk_id, document_id, content, embedding, metadata)
+            FROM STDIN
+            """
+        ).format(table=table)
+        self._count_sql = sql.SQL("SELECT COUNT(*) FROM {table} WHERE document_id = %s").format(
+            table=table
+        )
+        # Sample on the narrow chunk_id column first and inspect only the
+        # picked primary keys. The checks run server-side, so neither the
+        # vector nor the content and metadata text travel to the client.
+        self._sample_sql = sql.SQL(
+            """
+            SELECT chunk_id, vector_dims(embedding), content <> ''
+            FROM {table}
+            WHERE chunk_id IN (
+                SELECT chunk_id
+                FROM {table}
+                WHERE document_id = %s
+                ORDER BY random()
+                LIMIT 3
+            )
+            """
+        ).format(table=table)
+
     @contextmanager
     def get_conn(self) -> Iterator[PgConnection]:
         """Context manager yielding a PostgreSQL connection with transaction."""
 
-        conn = psycopg2.connect(self.dsn)
+        pool = self._get_pool()
+        conn = pool.getconn()
         try:
             yield conn
             conn.commit()
         except Exception:
-            conn.rollback()
+            if not conn.closed:
+                conn.rollback()
             LOGGER.exception("Transaction rolled back due to error.")
             raise
         finally:
-            conn.close()
+            # Broken connections are discarded rather than handed out again.
+            pool.putconn(conn, close=bool(conn.closed))
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.closeall()
+
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """Return the connection pool, creating it on first use."""
+
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadedConnectionPool(1, self.max_connections, dsn=self.dsn)
+            return self._pool
 
     def upsert_chunks(self, chunks: Iterable[Dict[str, object]]) -> None:
-        """Delete previous chunks and insert provided ones atomically."""
+        """Delete previous chunks and insert provided ones atomically.
 
-        chunk_list = list(chunks)
-        if not chunk_list:
+        ``chunks`` is consumed in batches of ``_COPY_MIN_ROWS``, so a
+        generator is never materialised in full. Documents with fewer chunks
+        are written in a single round trip; larger ones are streamed with one
+        COPY per batch.
+        """
+
+        chunk_iter = iter(chunks)
+        first_batch = list(islice(chunk_iter, _COPY_MIN_ROWS))
+        if not first_batch:
             raise PostgresWriterError("No chunks provided for upsert.")
 
-        document_id = chunk_list[0].get("document_id")
+        document_id = first_batch[0].get("document_id")
         if not document_id:
             raise PostgresWriterError("Chunks must include document_id.")
 
+        # Validate and format the first batch before checking out a
+        # connection, so a bad chunk there fails without any database I/O
+        # and the connection is held only for the writes themselves. Later
+        # batches are validated as they arrive; a failure rolls back.
+        use_copy = len(first_batch) == _COPY_MIN_ROWS
+        rows = self._prepare_rows(first_batch, document_id, use_copy)
+
         with self.get_conn() as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    sql.SQL("DELETE FROM {table} WHERE document_id = %s").format(
-                        table=sql.Identifier(self.table)
-                    ),
-                    (document_id,),
-                )
+                if use_copy:
+                    cur.execute(self._delete_sql, (document_id,))
+                    self._copy_rows(cur, rows)
+                    while batch := list(islice(chunk_iter, _COPY_MIN_ROWS)):
+                        self._copy_rows(cur, self._prepare_rows(batch, document_id, True))
+                else:
+                    # The DELETE travels in the same query string as the single
+                    # multi-row INSERT, so replacing a document costs one round
+                    # trip. A data-modifying CTE is not used because PostgreSQL
+                    # runs it after the INSERT, which would then collide with
+                    # the rows still present. ``%`` in the bound document id is
+                    # escaped for execute_values' own placeholder parsing.
+                    delete_stmt = cur.mogrify(self._delete_sql, (document_id,))
+                    execute_values(
+                        cur,
+                        delete_stmt.replace(b"%", b"%%") + b";" + cur.mogrify(self._insert_sql),
+                        rows,
+                        template="(%s, %s, %s, %s::vector, %s::jsonb)",
+                        page_size=len(rows),
+                    )
 
-                insert_stmt = sql.SQL(
-                    """
-                    INSERT INTO {table}
-                        (chunk_id, document_id, content, embedding, metadata)
-                    VALUES
-                        (%s, %s, %s, %s::vector, %s::jsonb)
-                    """
-                ).format(table=sql.Identifier(self.table))
-
-                for chunk in chunk_list:
-                    if chunk.get("document_id") != document_id:
-                        raise PostgresWriterError("All chunks must share the same document_id.")
-                    embedding = chunk.get("embedding")
-                    if not isinstance(embedding, list):
-                        raise PostgresWriterError("Chunk embedding must be a list of floats.")
-                    if len(embedding) != self.vector_dimension:
-                        raise PostgresWriterError(
-                            f"Embedding dimension mismatch: expected {self.vector_dimension}, got {len(embedding)}"
-                        )
+    def _prepare_rows(
+        self,
+        chunk_list: Sequence[Dict[str, object]],
+        document_id: object,
+        use_copy: bool,
+    ) -> List[tuple]:
+        """Validate chunks and return them as rows ready to be written.
+
+        Metadata is serialised to JSON text for COPY and wrapped in
+        :class:`~psycopg2.extras.Json` for INSERT statements.
+        """
+
+        rows = []
+        for chunk in chunk_list:
+            if chunk.get("document_id") != document_id:
+                raise PostgresWriterError("All chunks must share the same document_id.")
+            embedding = chunk.get("embedding")
+            if not isinstance(embedding, (list, array)):
+                raise PostgresWriterError("Chunk embedding must be a list or array of floats.")
+            if len(embedding) != self.vector_dimension:
+                raise PostgresWriterError(
+                    f"Embedding dimension mismatch: expected {self.vector_dimension}, got {len(embedding)}"
+                )
 
-                    embedding_str = self._format_vector(embedding)
-                    metadata = chunk.get("metadata", {})
-                    cur.execute(
-                        insert_stmt,
-                        (
-                            chunk.get("chunk_id"),
-                            chunk.get("document_id"),
-                            chunk.get("content"),
-                            embedding_str,
-                            Json(metadata),
-                        ),
-                    )
+            metadata = chunk.get("metadata", {})
+            rows.append(
+                (
+                    chunk.get("chunk_id"),
+                    document_id,
+                    chunk.get("content"),
+                    self._format_vector(embedding),
+                    json.dumps(metadata) if use_copy else Json(metadata),
+                )
+            )
+        return rows
+
+    def _copy_rows(self, cur: PgCursor, rows: Sequence[tuple]) -> None:
+        """Stream prepared rows into the table with a single COPY."""
+
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(
+                "\t".join(
+                    "\\N" if value is None else str(value).translate(_COPY_TEXT_ESCAPES)
+                    for value in row
+                )
+            )
+            buffer.write("\n")
+        buffer.seek(0)
+        cur.copy_expert(self._copy_sql, buffer)
 
     def sanity_check(self, document_id: str, expected_chunk_count: int) -> None:
         """Validate stored chunks for a given document."""
 
         with self.get_conn() as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    sql.SQL("SELECT COUNT(*) FROM {table} WHERE document_id = %s").format(
-                        table=sql.Identifier(self.table)
-                    ),
-                    (document_id,),
-                )
+                cur.execute(self._count_sql, (document_id,))
                 (count,) = cur.fetchone()
                 if count != expected_chunk_count:
                     raise PostgresWriterError(
                         f"Chunk count mismatch: expected {expected_chunk_count}, got {count}"
                     )
 
-                cur.execute(
-                    sql.SQL(
-                        """
-                        SELECT chunk_id, embedding::text, content, metadata::text
-                        FROM {table}
-                        WHERE document_id = %s
-                        ORDER BY random()
-                        LIMIT 3
-                        """
-                    ).format(table=sql.Identifier(self.table)),
-                    (document_id,),
-                )
+                cur.execute(self._sample_sql, (document_id,))
                 rows = cur.fetchall()
-                for chunk_id, embedding_text, content, metadata_text in rows:
-                    vector = self._parse_vector(embedding_text)
-                    if len(vector) != self.vector_dimension:
+                # Metadata is stored as JSONB, which the server validated on
+                # insert, so it needs no client-side check.
+                for chunk_id, dimension, has_content in rows:
+                    if dimension != self.vector_dimension:
                         raise PostgresWriterError(
-                            f"Embedding dimension mismatch for chunk {chunk_id}: {len(vector)}"
+                            f"Embedding dimension mismatch for chunk {chunk_id}: {dimension}"
                         )
-                    if not content:
+                    if not has_content:
                         raise PostgresWriterError(f"Chunk {chunk_id} has empty content.")
-                    try:
-                        json.loads(metadata_text or "{}")
-                    except json.JSONDecodeError as exc:
-                        raise PostgresWriterError(
-                            f"Invalid metadata JSON for chunk {chunk_id}."
-                        ) from exc
-
-    def _format_vector(self, embedding: List[float]) -> str:
-        """Convert embedding list to pgvector textual representation."""
 
-        return "[" + ",".join(f"{value:.8f}" for value in embedding) + "]"
+    def _format_vector(self, embedding: Sequence[float]) -> str:
+        """Convert embedding list to pgvector textual representation.
 
-    def _parse_vector(self, embedding_text: str) -> List[float]:
-        """Parse pgvector textual representation back to floats."""
+        With orjson available the vector is written as a JSON array of
+        shortest round-trip floats, which pgvector parses directly.
+        """
 
-        embedding_text = embedding_text.strip()[1:-1]
-        if not embedding_text:
-            return []
-        return [float(value) for value in embedding_text.split(",")]
+        if orjson is not None:
+            values = embedding.tolist() if isinstance(embedding, array) else embedding
+            return orjson.dumps(values).decode("ascii")
+        return "[" + ",".join(f"{value:.8f}" for value in embedding) + "]"
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+from pathlib import Path
 from typing import Any, Dict, List
 
 import pytest
@@ -7,6 +9,7 @@ import pytest
 import chunkers.pipeline as pipeline
 
 from chunkers.pipeline import Chunker
+from chunkers.title_cache import TitleCache
 from embedders import EmbeddingClientError
 
 
@@ -45,7 +48,8 @@ def test_chunking_pipeline_complex_doc(monkeypatch: pytest.MonkeyPatch) -> None:
     assert [
         chunk["chunk_id"] for chunk in result
     ] == [f"DOC001-{idx}" for idx in range(len(result))]
-    assert calls  # recursive splits should trigger LLM for overflow segments
+    assert len(calls) == 1  # overflow segments are titled in a single batch
+    assert len(calls[0]) >= 2
     assert any(
         chunk["metadata"]["section"] == "深度解析" for chunk in result
     ), "First segment of heading should retain original title"
@@ -86,6 +90,36 @@ def test_chunking_pipeline_output_format(monkeypatch: pytest.MonkeyPatch) -> Non
     assert captured_texts and captured_texts[0][0] == content
 
 
+def test_chunking_pipeline_titles_segments_from_inline_headings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: List[List[str]] = []
+
+    def fake_generate(self, texts: List[str]) -> List[str]:
+        calls.append(texts)
+        return ["自动摘要" for _ in texts]
+
+    monkeypatch.setattr(
+        pipeline.EmbeddingClient,
+        "generate_section_titles",
+        fake_generate,
+    )
+
+    chunker = Chunker(chunk_size=80, overlap=10)
+    document_content = "# 第一章\n" + "内容。" * 30 + "\n# 第二章\n" + "更多内容。" * 20
+    result = chunker.chunk(
+        document_content=document_content,
+        document_id="DOC-H1",
+        metadata_base={"title": "章节文档"},
+    )
+
+    titled = [chunk for chunk in result if "# 第二章\n" in chunk["content"]]
+    assert titled
+    assert all(chunk["metadata"]["section"] == "第二章" for chunk in titled)
+    sent = [text for batch in calls for text in batch]
+    assert all("# 第二章\n" not in text for text in sent)
+
+
 def test_chunking_pipeline_llm_failure_returns_empty_section(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -107,3 +141,170 @@ def test_chunking_pipeline_llm_failure_returns_empty_section(
     )
 
     assert result[0]["metadata"]["section"] == "另一个无标题段落。"
+
+
+def test_chunking_pipeline_disable_llm_skips_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fake_generate(self, texts: List[str]) -> List[str]:
+        raise AssertionError("LLM should not be called when disabled")
+
+    monkeypatch.setattr(
+        pipeline.EmbeddingClient,
+        "generate_section_titles",
+        fake_generate,
+    )
+
+    chunker = Chunker(chunk_size=200, overlap=30)
+    chunker.disable_llm()
+    result = chunker.chunk(
+        document_content="没有标题的内容。",
+        document_id="DOC-OFF",
+        metadata_base={"title": "禁用测试"},
+    )
+
+    assert result[0]["metadata"]["section"] == "没有标题的内容。"
+
+
+def test_chunking_pipeline_reuses_cached_titles(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: List[List[str]] = []
+
+    def fake_generate(self, texts: List[str]) -> List[str]:
+        calls.append(texts)
+        return ["缓存标题" for _ in texts]
+
+    monkeypatch.setattr(
+        pipeline.EmbeddingClient,
+        "generate_section_titles",
+        fake_generate,
+    )
+
+    chunker = Chunker(chunk_size=200, overlap=30)
+    content = "重复出现的样板段落。"
+    first = chunker.chunk(content, document_id="DOC-A", metadata_base={})
+    second = chunker.chunk(content, document_id="DOC-B", metadata_base={})
+
+    assert len(calls) == 1
+    assert first[0]["metadata"]["section"] == "缓存标题"
+    assert second[0]["metadata"]["section"] == "缓存标题"
+
+
+def test_title_cache_evicts_least_recently_used() -> None:
+    cache = TitleCache(max_entries=2)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    assert cache.get("a") == "A"
+
+    cache.set("c", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+    assert len(cache) == 2
+
+
+def test_chunker_builds_section_client_only_when_titles_are_needed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def unexpected_client() -> None:
+        raise AssertionError("section client should not be constructed")
+
+    monkeypatch.setattr(pipeline, "EmbeddingClient", unexpected_client)
+
+    chunker = Chunker(chunk_size=200, overlap=30)
+    chunker.disable_llm()
+    result = chunker.chunk(
+        document_content="## 标题\n正文内容。",
+        document_id="DOC-LAZY",
+        metadata_base={"title": "延迟"},
+    )
+
+    assert result[0]["metadata"]["section"] == "标题"
+
+
+def test_generate_section_titles_sends_duplicate_contents_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: List[List[str]] = []
+
+    def fake_generate(self, texts: List[str]) -> List[str]:
+        calls.append(texts)
+        return [f"标题{text}" for text in texts]
+
+    monkeypatch.setattr(
+        pipeline.EmbeddingClient,
+        "generate_section_titles",
+        fake_generate,
+    )
+
+    chunker = Chunker()
+    titles = chunker._generate_section_titles(["甲", "乙", "甲"])
+
+    assert titles == ["标题甲", "标题乙", "标题甲"]
+    assert calls == [["甲", "乙"]]
+
+
+def test_generate_section_titles_keeps_other_titles_when_one_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fake_call(self, text: str) -> str:
+        if text == "乙":
+            raise RuntimeError("section API down")
+        return f"标题{text}"
+
+    monkeypatch.setattr(pipeline.EmbeddingClient, "_call_section_api", fake_call)
+    monkeypatch.setattr("embedders.qwen_client.time.sleep", lambda seconds: None)
+
+    chunker = Chunker()
+    titles = chunker._generate_section_titles(["甲", "乙", "丙"])
+
+    assert titles == ["标题甲", "", "标题丙"]
+    assert len(chunker.title_cache) == 2
+
+
+def test_api_config_shared_across_chunkers_until_modified(tmp_path: Path) -> None:
+    config_path = tmp_path / "llm_config.json"
+    config_path.write_text('{"model": "a"}', encoding="utf-8")
+
+    first = Chunker(config_path=config_path, section_client=None)._load_api_config()
+    second = Chunker(config_path=config_path, section_client=None)._load_api_config()
+    assert first is second
+
+    config_path.write_text('{"model": "b"}', encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = Chunker(config_path=config_path, section_client=None)._load_api_config()
+    assert reloaded == {"model": "b"}
+
+
+def test_chunking_pipeline_reuses_titles_for_near_duplicates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: List[List[str]] = []
+
+    def fake_generate(self, texts: List[str]) -> List[str]:
+        calls.append(texts)
+        return [f"标题{len(calls)}" for _ in texts]
+
+    monkeypatch.setattr(
+        pipeline.EmbeddingClient,
+        "generate_section_titles",
+        fake_generate,
+    )
+
+    chunker = Chunker(chunk_size=200, overlap=30, title_cache=TitleCache(near_duplicate_distance=10))
+    original = "本产品适用于家庭环境，使用前请仔细阅读说明书并妥善保管，如有疑问请联系售后服务中心。"
+    variant = original.replace("保管", "保存")
+    unrelated = "按摩椅的电源开关位于座架下方，接通电源后按摩椅自动复位。"
+
+    first = chunker.chunk(original, document_id="DOC-A", metadata_base={})
+    second = chunker.chunk(variant, document_id="DOC-B", metadata_base={})
+    third = chunker.chunk(unrelated, document_id="DOC-C", metadata_base={})
+
+    assert len(calls) == 2
+    assert first[0]["metadata"]["section"] == "标题1"
+    assert second[0]["metadata"]["section"] == "标题1"
+    assert third[0]["metadata"]["section"] == "标题2"
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List
 
 import psycopg2
 import pytest
@@ -61,11 +61,13 @@ def setup_database() -> None:
 
 
 @pytest.fixture
-def writer(monkeypatch: pytest.MonkeyPatch) -> PostgresWriter:
+def writer(monkeypatch: pytest.MonkeyPatch) -> Iterator[PostgresWriter]:
     monkeypatch.setenv("POSTGRES_DSN", DSN)
     monkeypatch.setenv("POSTGRES_TABLE", TEST_TABLE)
     monkeypatch.setenv("POSTGRES_VECTOR_DIMENSION", str(VECTOR_DIM))
-    return PostgresWriter()
+    pg_writer = PostgresWriter()
+    yield pg_writer
+    pg_writer.close()
 
 
 def test_upsert_chunks_success(writer: PostgresWriter) -> None:
@@ -100,3 +102,24 @@ def test_sanity_check(writer: PostgresWriter) -> None:
     doc_id = "doc-sanity"
     writer.upsert_chunks(list(_make_chunks(doc_id, 2)))
     writer.sanity_check(doc_id, expected_chunk_count=2)
+
+
+def test_upsert_large_batch_round_trips_special_characters(writer: PostgresWriter) -> None:
+    doc_id = "doc-copy"
+    chunks = list(_make_chunks(doc_id, 1000))
+    chunks[0]["content"] = "tab\there\nnew line \\ backslash"
+    chunks[0]["metadata"] = {"note": "line\nbreak"}
+    writer.upsert_chunks(chunks)
+
+    rows = _fetch_all(doc_id)
+    assert len(rows) == 1000
+    stored = {chunk_id: (content, json.loads(metadata_text)) for chunk_id, _, content, _, metadata_text in rows}
+    assert stored[f"{doc_id}-0"] == (chunks[0]["content"], chunks[0]["metadata"])
+
+
+def test_upsert_streams_generator_in_batches(writer: PostgresWriter) -> None:
+    doc_id = "doc-stream"
+    writer.upsert_chunks(_make_chunks(doc_id, 2500))
+
+    assert len(_fetch_all(doc_id)) == 2500
+    writer.sanity_check(doc_id, expected_chunk_count=2500)
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+import json
+import multiprocessing
+import os
+import threading
+import time
 from pathlib import Path
 from typing import Any, Dict, List
 
 import pytest
+import requests
 
-from embedders.qwen_client import EmbeddingClient, EmbeddingClientError
+from embedders import EmbeddingCache
+from embedders.qwen_client import (
+    EmbeddingClient,
+    EmbeddingClientError,
+    _enqueue_json_log,
+    _flush_json_logs,
+    _load_api_key,
+)
 
 
 class DummyResponse:
@@ -13,6 +26,9 @@ class DummyResponse:
         self.status_code = status_code
         self._payload = payload or {}
         self.text = text
+        body = json.dumps(self._payload) if payload is not None else text
+        self.content = body.encode("utf-8")
+        self.headers: Dict[str, str] = {}
 
     def json(self) -> Dict[str, Any]:
         return self._payload
@@ -21,8 +37,8 @@ class DummyResponse:
 def test_embed_success(monkeypatch: pytest.MonkeyPatch) -> None:
     captured_payloads: List[Dict[str, Any]] = []
 
-    def fake_post(url: str, headers: Dict[str, str], json: Dict[str, Any], timeout: float) -> DummyResponse:
-        captured_payloads.append(json)
+    def fake_post(self: requests.Session, url: str, **kwargs: Any) -> DummyResponse:
+        captured_payloads.append(json.loads(kwargs["data"]))
         return DummyResponse(
             200,
             {
@@ -33,7 +49,7 @@ def test_embed_success(monkeypatch: pytest.MonkeyPatch) -> None:
             },
         )
 
-    monkeypatch.setattr("requests.post", fake_post)
+    monkeypatch.setattr(requests.Session, "post", fake_post)
 
     client = EmbeddingClient(api_key="test-key", max_batch_size=5)
     embeddings = client.embed(["foo", "bar"])
@@ -47,13 +63,13 @@ def test_embed_success(monkeypatch: pytest.MonkeyPatch) -> None:
 def test_embed_with_retry(monkeypatch: pytest.MonkeyPatch) -> None:
     attempts = {"count": 0}
 
-    def flaky_post(url: str, headers: Dict[str, str], json: Dict[str, Any], timeout: float) -> DummyResponse:
+    def flaky_post(self: requests.Session, url: str, **kwargs: Any) -> DummyResponse:
         attempts["count"] += 1
         if attempts["count"] < 3:
             return DummyResponse(500, text="temporary failure")
         return DummyResponse(200, {"data": [{"embedding": [0.1, 0.1]}]})
 
-    monkeypatch.setattr("requests.post", flaky_post)
+    monkeypatch.setattr(requests.Session, "post", flaky_post)
 
     client = EmbeddingClient(api_key="test-key", max_batch_size=1)
     embeddings = client.embed(["hello"])
@@ -63,10 +79,10 @@ def test_embed_with_retry(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 def test_embed_permanent_failure(monkeypatch: pytest.MonkeyPatch) -> None:
-    def failing_post(url: str, headers: Dict[str, str], json: Dict[str, Any], timeout: float) -> DummyResponse:
+    def failing_post(self: requests.Session, url: str, **kwargs: Any) -> DummyResponse:
         raise RuntimeError("network down")
 
-    monkeypatch.setattr("requests.post", failing_post)
+    monkeypatch.setattr(requests.Session, "post", failing_post)
 
     client = EmbeddingClient(api_key="test-key", max_batch_size=2)
 
@@ -75,7 +91,7 @@ def test_embed_permanent_failure(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 def test_embed_logs_request_and_response(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    def fake_post(url: str, headers: Dict[str, str], json: Dict[str, Any], timeout: float) -> DummyResponse:
+    def fake_post(self: requests.Session, url: str, **kwargs: Any) -> DummyResponse:
         return DummyResponse(
             200,
             {
@@ -85,12 +101,216 @@ def test_embed_logs_request_and_response(monkeypatch: pytest.MonkeyPatch, tmp_pa
             },
         )
 
-    monkeypatch.setattr("requests.post", fake_post)
+    monkeypatch.setattr(requests.Session, "post", fake_post)
 
     client = EmbeddingClient(api_key="test-key", max_batch_size=4)
     client.set_log_dir(tmp_path)
     client.embed(["only one"])
 
     files = sorted(path.name for path in tmp_path.iterdir())
-    assert "0000_request.json" in files
-    assert "0000_response.json" in files
+    assert files == ["0000.json"]
+    log = json.loads((tmp_path / "0000.json").read_text(encoding="utf-8"))
+    assert log["payload"]["input"] == ["only one"]
+    assert log["response"] == {"data": [{"embedding": [0.1, 0.1, 0.1]}]}
+
+
+def test_embed_log_writer_survives_unserialisable_record(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    def fake_post(self: requests.Session, url: str, **kwargs: Any) -> DummyResponse:
+        return DummyResponse(200, {"data": [{"embedding": [0.2, 0.2]}]})
+
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+    monkeypatch.setattr("embedders.qwen_client.time.sleep", lambda seconds: None)
+
+    client = EmbeddingClient(api_key="test-key", max_batch_size=4)
+    client.set_log_dir(tmp_path)
+
+    # A lone surrogate cannot be encoded as UTF-8 in the request or its log.
+    with pytest.raises(EmbeddingClientError):
+        client.embed(["bad \ud800 text"])
+
+    assert client.embed(["good text"]) == [[0.2, 0.2]]
+    log = json.loads((tmp_path / "0000.json").read_text(encoding="utf-8"))
+    assert log["payload"]["input"] == ["good text"]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_log_writer_restarts_in_forked_child(tmp_path: Path) -> None:
+    _enqueue_json_log(tmp_path / "parent.json", {"from": "parent"})
+    _flush_json_logs()
+
+    def child() -> None:
+        _enqueue_json_log(tmp_path / "child.json", {"from": "child"})
+        _flush_json_logs()
+
+    process = multiprocessing.get_context("fork").Process(target=child)
+    process.start()
+    process.join(timeout=10)
+    if process.is_alive():
+        process.kill()
+        process.join()
+        pytest.fail("log flush hung in the forked child")
+
+    assert process.exitcode == 0
+    assert json.loads((tmp_path / "child.json").read_text(encoding="utf-8")) == {"from": "child"}
+
+
+def test_generate_section_titles_payload(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured_payloads: List[Dict[str, Any]] = []
+
+    def fake_post(self: requests.Session, url: str, **kwargs: Any) -> DummyResponse:
+        captured_payloads.append(json.loads(kwargs["data"]))
+        return DummyResponse(200, {"choices": [{"message": {"content": " 标题 "}}]})
+
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+
+    client = EmbeddingClient(api_key="test-key")
+    titles = client.generate_section_titles(["第一段", "第二段"])
+
+    assert titles == ["标题", "标题"]
+    assert [payload["messages"][0]["content"][-3:] for payload in captured_payloads] == ["第一段", "第二段"]
+    assert all(payload["model"] == client.section_model for payload in captured_payloads)
+    assert all(payload["temperature"] == 0.3 for payload in captured_payloads)
+
+
+def test_requests_share_pooled_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    sessions: List[requests.Session] = []
+
+    def fake_post(self: requests.Session, url: str, **kwargs: Any) -> DummyResponse:
+        sessions.append(self)
+        return DummyResponse(200, {"data": [{"embedding": [0.5]}]})
+
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+
+    client = EmbeddingClient(api_key="test-key", max_batch_size=1)
+    client.embed(["a", "b"])
+    client.close()
+
+    assert len(sessions) == 2
+    assert sessions[0] is sessions[1]
+
+
+def test_generate_section_titles_runs_concurrently_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def fake_post(self: requests.Session, url: str, **kwargs: Any) -> DummyResponse:
+        text = json.loads(kwargs["data"])["messages"][0]["content"][-1]
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.05 if text in "ab" else 0.01)
+        with lock:
+            state["active"] -= 1
+        return DummyResponse(200, {"choices": [{"message": {"content": text.upper()}}]})
+
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+
+    client = EmbeddingClient(api_key="test-key", section_concurrency=2)
+    titles = client.generate_section_titles(["a", "b", "c", "d"])
+
+    assert titles == ["A", "B", "C", "D"]
+    assert state["peak"] == 2
+
+
+def test_section_batch_size_is_a_deprecated_alias() -> None:
+    with pytest.warns(DeprecationWarning, match="section_concurrency"):
+        client = EmbeddingClient(api_key="test-key", section_batch_size=3)
+
+    assert client.section_concurrency == 3
+
+
+def test_embed_batches_run_concurrently_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_post(self: requests.Session, url: str, **kwargs: Any) -> DummyResponse:
+        batch = json.loads(kwargs["data"])["input"]
+        time.sleep(0.05 if batch == ["a"] else 0.0)
+        return DummyResponse(200, {"data": [{"embedding": [float(ord(text))]} for text in batch]})
+
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+
+    client = EmbeddingClient(api_key="test-key", max_batch_size=1, embed_concurrency=3)
+    embeddings = client.embed(["a", "b", "c"])
+
+    assert embeddings == [[97.0], [98.0], [99.0]]
+
+
+def test_session_carries_auth_headers() -> None:
+    client = EmbeddingClient(api_key="test-key")
+
+    assert client._session.headers["Authorization"] == "Bearer test-key"
+    assert client._session.headers["Content-Type"] == "application/json"
+    assert client._session.headers["Accept-Encoding"] == "gzip, deflate"
+    client.close()
+
+
+def test_session_pool_fits_all_request_workers() -> None:
+    client = EmbeddingClient(api_key="test-key", embed_concurrency=3, section_concurrency=5)
+
+    adapter = client._session.get_adapter(client.section_base_url)
+    assert adapter is client._session.get_adapter(client.base_url)
+    assert adapter._pool_maxsize == 8
+    client.close()
+
+
+def test_api_key_config_parsed_once_until_modified(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.delenv("EMBEDDING_API_KEY", raising=False)
+    config_path = tmp_path / "embedding.json"
+    config_path.write_text('{"api_key": "first"}', encoding="utf-8")
+    reads: List[Path] = []
+    original_read_bytes = Path.read_bytes
+
+    def counting_read_bytes(self: Path) -> bytes:
+        reads.append(self)
+        return original_read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+
+    assert _load_api_key(config_path) == "first"
+    assert _load_api_key(config_path) == "first"
+    assert reads == [config_path]
+
+    config_path.write_text('{"api_key": "second"}', encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert _load_api_key(config_path) == "second"
+
+
+def test_embed_cache_skips_known_texts(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    requested: List[List[str]] = []
+
+    def fake_post(self: requests.Session, url: str, **kwargs: Any) -> DummyResponse:
+        batch = json.loads(kwargs["data"])["input"]
+        requested.append(batch)
+        return DummyResponse(200, {"data": [{"embedding": [float(ord(text)), 0.1]} for text in batch]})
+
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+
+    cache_path = tmp_path / "cache" / "embeddings.sqlite"
+    first = EmbeddingClient(api_key="test-key", cache=EmbeddingCache(cache_path))
+    assert first.embed(["a", "b"]) == [[97.0, 0.1], [98.0, 0.1]]
+
+    second = EmbeddingClient(api_key="test-key", cache=EmbeddingCache(cache_path))
+    assert second.embed(["b", "c", "a"]) == [[98.0, 0.1], [99.0, 0.1], [97.0, 0.1]]
+
+    assert requested == [["a", "b"], ["c"]]
+
+
+def test_embed_sends_duplicate_texts_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    requested: List[List[str]] = []
+
+    def fake_post(self: requests.Session, url: str, **kwargs: Any) -> DummyResponse:
+        batch = json.loads(kwargs["data"])["input"]
+        requested.append(batch)
+        return DummyResponse(200, {"data": [{"embedding": [float(ord(text))]} for text in batch]})
+
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+
+    client = EmbeddingClient(api_key="test-key", max_batch_size=8)
+    embeddings = client.embed(["a", "b", "a", "a"])
+
+    assert requested == [["a", "b"]]
+    assert embeddings == [[97.0], [98.0], [97.0], [97.0]]
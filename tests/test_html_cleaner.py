@@ -5,6 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from cleaners import HtmlCleaner
+from cleaners.html import SimpleNode, _fallback_soup
 
 
 def _write_html(tmp_path: Path, filename: str, content: str) -> Path:
@@ -174,3 +175,71 @@ def test_html_cleaner_cleans_real_product_article() -> None:
     assert paragraph_count >= 4
     assert any("https://union-click.jd.com" in line for line in lines)
     assert "" in lines  # ensure blank line separates paragraphs
+
+
+def test_simple_node_decompose_all_matches_individual_decompose() -> None:
+    html = (
+        "<body><p>a</p><script>x</script><p>b</p>"
+        "<nav><script>y</script><p>menu</p></nav><p>c</p><style>z</style></body>"
+    )
+    batched = _fallback_soup(html)
+    individual = _fallback_soup(html)
+
+    SimpleNode.decompose_all(batched.find_all({"script", "style", "nav"}))
+    for node in individual.find_all({"script", "style", "nav"}):
+        node.decompose()
+
+    def shape(node: SimpleNode) -> list:
+        return [
+            (child.name, shape(child)) if isinstance(child, SimpleNode) else child
+            for child in node.children
+        ]
+
+    assert shape(batched) == shape(individual)
+    assert [child.name for child in batched.body.children] == ["p", "p", "p"]
+
+
+def test_html_cleaner_heading_ignores_candidates_inside_removed_nodes(tmp_path: Path) -> None:
+    cleaner = HtmlCleaner()
+    html = """
+    <html>
+      <head><title>Site | Fallback Title</title></head>
+      <body>
+        <header><h1>Site Header</h1></header>
+        <h1></h1>
+        <p>Body text.</p>
+      </body>
+    </html>
+    """
+    html_path = _write_html(tmp_path, "removed.html", html)
+
+    result = cleaner.clean(str(html_path))
+
+    assert result.splitlines()[0] == "# Fallback Title"
+    assert "Site Header" not in result
+
+
+def test_simple_node_find_all_handles_deep_nesting_in_document_order() -> None:
+    depth = 5000
+    soup = _fallback_soup("<div>" * depth + "<p>leaf</p>" + "</div>" * depth)
+
+    assert len(soup.find_all({"div"})) == depth
+
+    ordered = _fallback_soup("<div><p>a</p><ul><li>b</li></ul></div><p>c</p>")
+    assert [node.name for node in ordered.find_all()] == ["div", "p", "ul", "li", "p"]
+
+
+def test_fallback_parser_end_tag_closes_innermost_matching_element() -> None:
+    soup = _fallback_soup("<div><p><span>a</div>b</span><p>c</p>")
+
+    def shape(node: SimpleNode) -> tuple:
+        return (
+            node.name,
+            [shape(child) if isinstance(child, SimpleNode) else child for child in node.children],
+        )
+
+    # </div> closes the open <p> and <span> too; the stray </span> is ignored.
+    assert shape(soup) == (
+        "document",
+        [("div", [("p", [("span", ["a"])])]), "b", ("p", ["c"])],
+    )
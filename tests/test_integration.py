@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import json
-import os
-import subprocess
 import sys
 from pathlib import Path
 from typing import List
 
 import pytest
 
-from tools.ingest import ingest_document
+import main_chunker
+import tools.ingest
+from cleaners import HtmlCleaner
+from tools.ingest import clean_document, ingest_directory, ingest_document
 
 
 def read_jsonl(path: Path) -> List[dict]:
@@ -17,7 +18,7 @@ def read_jsonl(path: Path) -> List[dict]:
         return [json.loads(line) for line in handle if line.strip()]
 
 
-def test_chunker_cli_generates_output(tmp_path: Path) -> None:
+def test_chunker_cli_generates_output(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     cleaned_text = tmp_path / "sample.txt"
     cleaned_text.write_text(
         "## 标题\n这是第一段。\n\n这是第二段。",
@@ -27,12 +28,11 @@ def test_chunker_cli_generates_output(tmp_path: Path) -> None:
     output_dir = tmp_path / "chunks"
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(Path.cwd())
-
-    result = subprocess.run(
+    # Run the CLI entry point in-process instead of spawning an interpreter.
+    monkeypatch.setattr(
+        sys,
+        "argv",
         [
-            sys.executable,
             "main_chunker.py",
             "--input-file",
             str(cleaned_text),
@@ -44,14 +44,9 @@ def test_chunker_cli_generates_output(tmp_path: Path) -> None:
             str(output_dir),
             "--disable-llm",
         ],
-        capture_output=True,
-        text=True,
-        env=env,
-        cwd=Path.cwd(),
-        check=True,
     )
+    main_chunker.main()
 
-    assert result.returncode == 0
     chunks_path = output_dir / "DOC001.jsonl"
     assert chunks_path.exists()
 
@@ -69,11 +64,11 @@ def test_e2e_ingestion_produces_chunks(tmp_path: Path, monkeypatch: pytest.Monke
     )
 
     # Avoid hitting external LLM service during tests.
-    def _fake_generate(self, text: str) -> str:
-        return "自动摘要"
+    def _fake_generate(self, texts: List[str]) -> List[str]:
+        return ["自动摘要" for _ in texts]
 
     monkeypatch.setattr(
-        "chunkers.pipeline.Chunker._generate_section_title",
+        "chunkers.pipeline.Chunker._generate_section_titles",
         _fake_generate,
     )
 
@@ -98,3 +93,84 @@ def test_e2e_ingestion_produces_chunks(tmp_path: Path, monkeypatch: pytest.Monke
     assert first_chunk["metadata"]["title"] == "示例文档"
     assert first_chunk["metadata"]["chunk_index"] == 0
     assert "content" in first_chunk and first_chunk["content"]
+
+
+def test_clean_document_reuses_cached_text_for_unchanged_input(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    raw_file = tmp_path / "cached.html"
+    raw_file.write_text("<html><body><h2>缓存</h2><p>内容。</p></body></html>", encoding="utf-8")
+    clean_dir = tmp_path / "clean"
+    cache_dir = tmp_path / "clean-cache"
+
+    calls: List[str] = []
+    original_clean = HtmlCleaner.clean
+
+    def _counting_clean(self: HtmlCleaner, file_path: str) -> str:
+        calls.append(file_path)
+        return original_clean(self, file_path)
+
+    monkeypatch.setattr(HtmlCleaner, "clean", _counting_clean)
+
+    first_path, first_text = clean_document(raw_file, clean_dir, cache_dir)
+    second_path, second_text = clean_document(raw_file, clean_dir, cache_dir)
+    assert (second_path, second_text) == (first_path, first_text)
+    assert len(calls) == 1
+
+    raw_file.write_text("<html><body><h2>缓存</h2><p>新内容。</p></body></html>", encoding="utf-8")
+    _, changed_text = clean_document(raw_file, clean_dir, cache_dir)
+    assert "新内容" in changed_text
+    assert len(calls) == 2
+
+    clean_document(raw_file, clean_dir)
+    assert len(calls) == 3
+
+
+def test_ingest_directory_ingests_supported_files_in_name_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    input_dir = tmp_path / "raw"
+    input_dir.mkdir()
+    for name in ("b.html", "a.md", "notes.txt"):
+        (input_dir / name).write_text("# Title", encoding="utf-8")
+    (input_dir / "nested.html").mkdir()
+    calls: List[tuple] = []
+
+    def recording_ingest(input_file: Path, **options: object) -> Path:
+        calls.append((input_file.name, options))
+        return tmp_path / f"{input_file.stem}.jsonl"
+
+    monkeypatch.setattr(tools.ingest, "ingest_document", recording_ingest)
+
+    outputs = ingest_directory(input_dir, max_workers=1, use_llm=False)
+
+    assert [name for name, _ in calls] == ["a.md", "b.html"]
+    assert all(options == {"use_llm": False} for _, options in calls)
+    assert [path.name for path in outputs] == ["a.jsonl", "b.jsonl"]
+
+
+def test_ingestion_reuses_one_chunker_per_option_set(tmp_path: Path) -> None:
+    log_dir = tmp_path / "llm_logs"
+
+    shared = tools.ingest._get_chunker(False, log_dir)
+
+    assert tools.ingest._get_chunker(False, log_dir) is shared
+    assert tools.ingest._get_chunker(True, log_dir) is not shared
+    assert shared.llm_log_dir == log_dir
+
+
+def test_ingest_directory_rejects_files_sharing_a_document_id(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    input_dir = tmp_path / "raw"
+    input_dir.mkdir()
+    for name in ("a.html", "a.md", "b.md"):
+        (input_dir / name).write_text("# Title", encoding="utf-8")
+
+    def unexpected_ingest(input_file: Path, **options: object) -> Path:
+        raise AssertionError("no document should be ingested")
+
+    monkeypatch.setattr(tools.ingest, "ingest_document", unexpected_ingest)
+
+    with pytest.raises(ValueError, match="a.html and a.md"):
+        ingest_directory(input_dir, max_workers=1)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import time
 from pathlib import Path
 from typing import List
 
@@ -11,15 +12,14 @@ from loaders.main_loader import EmbeddingLoader
 
 
 class DummyEmbeddingClient:
-    def __init__(self, results: List[List[float]] | None = None, fail_once: bool = False) -> None:
+    def __init__(self, results: List[List[float]] | None = None, fail_on: str | None = None) -> None:
         self.results = results or []
-        self.fail_once = fail_once
+        self.fail_on = fail_on
         self.calls: List[List[str]] = []
 
     def embed(self, texts: List[str]) -> List[List[float]]:
         self.calls.append(texts)
-        if self.fail_once:
-            self.fail_once = False
+        if self.fail_on is not None and self.fail_on in texts:
             raise EmbeddingClientError("embedding error")
         return self.results.pop(0)
 
@@ -73,7 +73,7 @@ def test_loader_handles_embedding_failures(tmp_path: Path) -> None:
     ]
     _write_jsonl(jsonl_path, chunks)
 
-    embedding_client = DummyEmbeddingClient(results=[[[0.5, 0.6]], [[0.7, 0.8]]], fail_once=True)
+    embedding_client = DummyEmbeddingClient(results=[[[0.5, 0.6]], [[0.7, 0.8]]], fail_on="fail")
     writer = DummyPostgresWriter()
     loader = EmbeddingLoader(embedding_client=embedding_client, postgres_writer=writer, batch_size=1, dead_letter_dir=tmp_path / "dead")
 
@@ -86,3 +86,32 @@ def test_loader_handles_embedding_failures(tmp_path: Path) -> None:
     assert writer.upsert_args is not None
     assert len(writer.upsert_args) == 2
     assert writer.sanity_args == ("doc2", 2)
+
+
+def test_loader_embeds_batches_concurrently_in_order(tmp_path: Path) -> None:
+    jsonl_path = tmp_path / "doc3.jsonl"
+    chunks = [
+        {"chunk_id": f"doc3-{index}", "document_id": "doc3", "content": str(index), "metadata": {}}
+        for index in range(4)
+    ]
+    _write_jsonl(jsonl_path, chunks)
+
+    class SlowFirstClient:
+        def embed(self, texts: List[str]) -> List[List[float]]:
+            if texts == ["0"]:
+                time.sleep(0.05)
+            return [[float(text)] for text in texts]
+
+    writer = DummyPostgresWriter()
+    loader = EmbeddingLoader(
+        embedding_client=SlowFirstClient(),
+        postgres_writer=writer,
+        batch_size=1,
+        dead_letter_dir=tmp_path / "dead",
+        max_workers=4,
+    )
+
+    loader.run(jsonl_path)
+
+    assert [chunk["chunk_id"] for chunk in writer.upsert_args] == [f"doc3-{index}" for index in range(4)]
+    assert [list(chunk["embedding"]) for chunk in writer.upsert_args] == [[0.0], [1.0], [2.0], [3.0]]
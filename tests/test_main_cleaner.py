@@ -0,0 +1,104 @@
+"""Tests for the cleaning CLI helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import main_cleaner
+from cleaners.cache import clean_cache_path, write_clean_cache
+from main_cleaner import clean_directory, clean_file, clean_files
+
+
+def test_clean_directory_cleans_supported_files_in_parallel(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    input_dir = tmp_path / "raw"
+    input_dir.mkdir()
+    (input_dir / "a.html").write_text("<html><body><h1>Alpha</h1><p>First.</p></body></html>", encoding="utf-8")
+    (input_dir / "b.html").write_text("<html><body><h1>Beta</h1><p>Second.</p></body></html>", encoding="utf-8")
+    (input_dir / "notes.txt").write_text("ignored", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    outputs = clean_directory(input_dir, max_workers=2)
+
+    assert [path.name for path in outputs] == ["a.txt", "b.txt"]
+    assert "Alpha" in (tmp_path / outputs[0]).read_text(encoding="utf-8")
+    assert "Beta" in (tmp_path / outputs[1]).read_text(encoding="utf-8")
+
+
+def test_clean_directory_rejects_files_sharing_a_stem(tmp_path: Path) -> None:
+    input_dir = tmp_path / "raw"
+    input_dir.mkdir()
+    (input_dir / "a.html").write_text("<h1>Alpha</h1>", encoding="utf-8")
+    (input_dir / "a.md").write_text("# Alpha", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="a.html and a.md"):
+        clean_directory(input_dir, max_workers=1)
+
+
+def test_clean_files_reuses_one_cleaner_per_extension(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    paths = []
+    for name in ("a.html", "b.html", "c.md"):
+        path = tmp_path / name
+        path.write_text("<h1>Title</h1>" if name.endswith(".html") else "# Title", encoding="utf-8")
+        paths.append(path)
+    resolved: list[Path] = []
+    original_resolve = main_cleaner.resolve_cleaner
+
+    def counting_resolve(file_path: Path) -> main_cleaner.BaseCleaner:
+        resolved.append(file_path)
+        return original_resolve(file_path)
+
+    monkeypatch.setattr(main_cleaner, "resolve_cleaner", counting_resolve)
+    monkeypatch.chdir(tmp_path)
+
+    outputs = clean_files(paths, max_workers=1)
+
+    assert [path.name for path in outputs] == ["a.txt", "b.txt", "c.txt"]
+    assert resolved == [paths[0], paths[2]]
+
+
+def test_clean_file_reuses_cached_output_for_unchanged_content(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    source = tmp_path / "doc.html"
+    source.write_text("<html><body><h1>Cached</h1><p>Body.</p></body></html>", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    monkeypatch.chdir(tmp_path)
+
+    first = clean_file(source, cache_dir=cache_dir)
+    expected = first.read_text(encoding="utf-8")
+    first.unlink()
+
+    def unexpected_resolve(file_path: Path) -> main_cleaner.BaseCleaner:
+        raise AssertionError("cached documents should not be cleaned again")
+
+    monkeypatch.setattr(main_cleaner, "resolve_cleaner", unexpected_resolve)
+    second = clean_file(source, cache_dir=cache_dir)
+
+    assert second.read_text(encoding="utf-8") == expected
+
+
+def test_clean_cache_key_covers_cleaner_class_and_writes_atomically(tmp_path: Path) -> None:
+    source = tmp_path / "doc.html"
+    source.write_text("<h1>Same bytes</h1>", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    html_entry = clean_cache_path(source, main_cleaner.HTMLCleaner, cache_dir)
+    markdown_entry = clean_cache_path(source, main_cleaner.MarkdownCleaner, cache_dir)
+    write_clean_cache(html_entry, "Same bytes".encode("utf-8"))
+
+    assert html_entry != markdown_entry
+    assert html_entry.read_text(encoding="utf-8") == "Same bytes"
+    assert [path.name for path in cache_dir.iterdir()] == [html_entry.name]
+
+
+def test_worker_processes_clean_pdf_pages_serially() -> None:
+    worker_pdf_cleaner = main_cleaner._WORKER_CLEANERS[".pdf"]
+
+    assert isinstance(worker_pdf_cleaner, main_cleaner.PdfCleaner)
+    assert worker_pdf_cleaner._max_workers == 1
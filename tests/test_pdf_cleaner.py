@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, Iterable, List
 
@@ -190,3 +191,45 @@ def test_pdf_cleaner_filters_numeric_noise(monkeypatch: pytest.MonkeyPatch) -> N
     result = cleaner.clean("ignored.pdf")
 
     assert result == "正常文本"
+
+
+def test_pdf_cleaner_parallel_pages_preserve_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    pages = [
+        _FakePage(
+            width=600.0,
+            height=800.0,
+            words=[_word(f"第{index}页。", top=200.0, bottom=210.0, x0=50.0, size=10.0)],
+        )
+        for index in range(1, 6)
+    ]
+    _patch_pdf(monkeypatch, _FakePDF(pages=pages))
+    monkeypatch.setattr("cleaners.pdf.ProcessPoolExecutor", ThreadPoolExecutor)
+
+    result = PdfCleaner(max_workers=2).clean("ignored.pdf")
+
+    assert result == "\n\n".join(f"第{index}页。" for index in range(1, 6))
+
+
+def test_pdf_cleaner_parallel_pages_use_subclass_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    class NoHeaderPdfCleaner(PdfCleaner):
+        HEADER_RATIO = 0.0
+
+    pages = [
+        _FakePage(
+            width=600.0,
+            height=800.0,
+            words=[
+                _word(f"页眉{index}", top=20.0, bottom=30.0, x0=50.0, size=10.0),
+                _word(f"第{index}页。", top=200.0, bottom=210.0, x0=50.0, size=10.0),
+            ],
+        )
+        for index in range(1, 6)
+    ]
+    _patch_pdf(monkeypatch, _FakePDF(pages=pages))
+    monkeypatch.setattr("cleaners.pdf.ProcessPoolExecutor", ThreadPoolExecutor)
+
+    serial = NoHeaderPdfCleaner(max_workers=1).clean("ignored.pdf")
+    parallel = NoHeaderPdfCleaner(max_workers=2).clean("ignored.pdf")
+
+    assert "页眉1" in serial
+    assert parallel == serial
@@ -41,6 +41,13 @@ def test_recursive_splitter_edge_cases() -> None:
     assert splitter.split(None) == []
 
 
+def test_recursive_splitter_iter_matches_split() -> None:
+    splitter = RecursiveTextSplitter(chunk_size=7, overlap=3)
+    for length in range(0, 30):
+        text = "abcdefghijklmnopqrstuvwxyz0123"[:length]
+        assert list(splitter.split_iter(text)) == splitter.split(text)
+
+
 def test_semantic_splitter_multiple_headings() -> None:
     splitter = SemanticSplitter()
     text = """## Introduction
@@ -5,21 +5,35 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+import cleaners
 from chunkers.pipeline import Chunker
-from cleaners import BaseCleaner, HTMLCleaner, MarkdownCleaner, PdfCleaner
-from embedders import EmbeddingClientError
+from cleaners import BaseCleaner
+from cleaners.cache import clean_cache_path, write_clean_cache
+from embedders import EmbeddingCache, EmbeddingClient, EmbeddingClientError
 from loaders import EmbeddingLoader
 from storages import PostgresWriterError
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the standard library
+    orjson = None
+
 LOGGER = logging.getLogger(__name__)
 
 DEFAULT_CLEAN_DIR = Path("data/clean")
 DEFAULT_CHUNKS_DIR = Path("data/chunks")
 DEFAULT_DEAD_LETTER_DIR = Path("data/dead_letters")
 
+# Chunk records are small, so a 1 MiB buffer turns thousands of them into a
+# handful of write syscalls instead of one per 8 KiB.
+_CHUNKS_WRITE_BUFFER = 1 << 20
+
 
 def configure_logging() -> None:
     """Configure application wide logging."""
@@ -30,41 +44,84 @@ def configure_logging() -> None:
     )
 
 
-def build_cleaner_registry() -> Dict[str, type[BaseCleaner]]:
-    """Return the mapping between file extensions and cleaner classes."""
+def build_cleaner_registry() -> Dict[str, str]:
+    """Return the mapping between file extensions and cleaner class names.
+
+    Names are resolved on the :mod:`cleaners` package only when a file needs
+    them, so ingesting an HTML file never imports pdfplumber and vice versa.
+    """
 
     return {
-        ".pdf": PdfCleaner,
-        ".html": HTMLCleaner,
-        ".htm": HTMLCleaner,
-        ".md": MarkdownCleaner,
-        ".markdown": MarkdownCleaner,
+        ".pdf": "PdfCleaner",
+        ".html": "HTMLCleaner",
+        ".htm": "HTMLCleaner",
+        ".md": "MarkdownCleaner",
+        ".markdown": "MarkdownCleaner",
     }
 
 
+# Built once at import; resolve_cleaner only performs a lookup per file.
+_CLEANER_REGISTRY: Dict[str, str] = build_cleaner_registry()
+
+# Cleaner instances shared by the worker processes of ingest_directory. Files
+# already run in parallel there, so PDF pages are cleaned serially instead of
+# each worker starting its own page pool.
+_WORKER_CLEANERS: Dict[str, BaseCleaner] = {}
+
+
+def _init_ingest_worker() -> None:
+    """Prepare the cleaners used inside an ingest_directory worker process."""
+
+    _WORKER_CLEANERS[".pdf"] = cleaners.PdfCleaner(max_workers=1)
+
+
 def resolve_cleaner(path: Path) -> BaseCleaner:
     """Instantiate a cleaner able to process ``path``."""
 
-    registry = build_cleaner_registry()
-    cleaner_cls = registry.get(path.suffix.lower())
-    if cleaner_cls is None:
+    worker_cleaner = _WORKER_CLEANERS.get(path.suffix.lower())
+    if worker_cleaner is not None:
+        return worker_cleaner
+    cleaner_name = _CLEANER_REGISTRY.get(path.suffix.lower())
+    if cleaner_name is None:
         msg = f"Unsupported file extension: {path.suffix or '<none>'}"
         raise ValueError(msg)
+    cleaner_cls: type[BaseCleaner] = getattr(cleaners, cleaner_name)
     return cleaner_cls()
 
 
-def clean_document(input_path: Path, output_dir: Path) -> Tuple[Path, str]:
-    """Clean ``input_path`` and persist the cleaned text within ``output_dir``."""
+def clean_document(
+    input_path: Path,
+    output_dir: Path,
+    cache_dir: Optional[Path] = None,
+) -> Tuple[Path, str]:
+    """Clean ``input_path`` and persist the cleaned text within ``output_dir``.
+
+    When ``cache_dir`` is given, cleaned texts are kept there keyed by
+    content, and an unchanged document is not cleaned again.
+    """
 
     if not input_path.exists():
         msg = f"File not found: {input_path}"
         raise FileNotFoundError(msg)
 
     cleaner = resolve_cleaner(input_path)
-    cleaned_text = cleaner.clean(str(input_path))
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / f"{input_path.stem}.txt"
-    output_path.write_text(cleaned_text, encoding="utf-8")
+
+    cache_path: Optional[Path] = None
+    if cache_dir is not None:
+        cache_path = clean_cache_path(input_path, type(cleaner), cache_dir)
+        if cache_path.exists():
+            cleaned_bytes = cache_path.read_bytes()
+            output_path.write_bytes(cleaned_bytes)
+            LOGGER.info("Reused cleaned text for %s -> %s", input_path, output_path)
+            return output_path, cleaned_bytes.decode("utf-8")
+
+    cleaned_text = cleaner.clean(str(input_path))
+    cleaned_bytes = cleaned_text.encode("utf-8")
+    output_path.write_bytes(cleaned_bytes)
+    if cache_path is not None:
+        write_clean_cache(cache_path, cleaned_bytes)
     LOGGER.info("Cleaned document %s -> %s", input_path, output_path)
     return output_path, cleaned_text
 
@@ -97,10 +154,30 @@ def load_metadata(
 def write_chunks(chunks: list[dict[str, Any]], output_path: Path) -> None:
     """Persist chunk dictionaries to ``output_path`` in JSONL format."""
 
-    with output_path.open("w", encoding="utf-8") as handle:
-        for chunk in chunks:
-            handle.write(json.dumps(chunk, ensure_ascii=False))
-            handle.write("\n")
+    with output_path.open("wb", buffering=_CHUNKS_WRITE_BUFFER) as handle:
+        if orjson is not None:
+            # The newline is appended by orjson, so each record is one write.
+            for chunk in chunks:
+                handle.write(orjson.dumps(chunk, option=orjson.OPT_APPEND_NEWLINE))
+        else:
+            for chunk in chunks:
+                handle.write((json.dumps(chunk, ensure_ascii=False) + "\n").encode("utf-8"))
+
+
+@lru_cache(maxsize=4)
+def _get_chunker(use_llm: bool, llm_log_dir: Optional[Path]) -> Chunker:
+    """Return the chunker shared by every document ingested with these options.
+
+    Reusing one instance per process keeps its section-title cache and its
+    lazily built LLM client across documents instead of rebuilding them.
+    """
+
+    chunker = Chunker()
+    if not use_llm:
+        chunker.disable_llm()
+    if llm_log_dir is not None:
+        chunker.set_llm_log_dir(llm_log_dir)
+    return chunker
 
 
 def ingest_document(
@@ -115,20 +192,18 @@ def ingest_document(
     llm_log_dir: Optional[Path] = None,
     loader_dead_letter_dir: Path = DEFAULT_DEAD_LETTER_DIR,
     loader_batch_size: int = 16,
+    embedding_cache_path: Optional[Path] = None,
+    clean_cache_dir: Optional[Path] = None,
 ) -> Path:
     """Execute the ingestion pipeline returning the chunks JSONL path."""
 
     doc_id = document_id or input_file.stem
     LOGGER.info("Starting ingestion for %s (document_id=%s)", input_file, doc_id)
 
-    clean_path, cleaned_text = clean_document(input_file, clean_output_dir)
+    clean_path, cleaned_text = clean_document(input_file, clean_output_dir, clean_cache_dir)
     metadata = load_metadata(doc_id, title=title, meta_path=meta_file)
 
-    chunker = Chunker()
-    if not use_llm:
-        chunker.disable_llm()
-    if llm_log_dir is not None:
-        chunker.set_llm_log_dir(llm_log_dir)
+    chunker = _get_chunker(use_llm, llm_log_dir)
 
     LOGGER.info(
         "Chunking document %s using LLM=%s (clean text length=%s)",
@@ -142,7 +217,13 @@ def ingest_document(
     chunks_path = chunks_output_dir / f"{doc_id}.jsonl"
     write_chunks(chunks, chunks_path)
 
+    embedding_client = (
+        EmbeddingClient(cache=EmbeddingCache(embedding_cache_path))
+        if embedding_cache_path is not None
+        else EmbeddingClient()
+    )
     loader = EmbeddingLoader(
+        embedding_client=embedding_client,
         batch_size=loader_batch_size,
         dead_letter_dir=loader_dead_letter_dir,
     )
@@ -151,6 +232,8 @@ def ingest_document(
     except (EmbeddingClientError, PostgresWriterError) as exc:
         LOGGER.exception("Loader failed for %s: %s", doc_id, exc)
         raise
+    finally:
+        loader.postgres_writer.close()
 
     LOGGER.info(
         "Ingestion finished for %s -> %s (clean: %s, chunk_count=%s)",
@@ -162,17 +245,80 @@ def ingest_document(
     return chunks_path
 
 
+def ingest_directory(
+    input_dir: Path,
+    *,
+    max_workers: Optional[int] = None,
+    **options: Any,
+) -> List[Path]:
+    """Ingest every supported document in ``input_dir`` using worker processes.
+
+    Parameters
+    ----------
+    input_dir:
+        Directory whose files with a known extension should be ingested.
+        Subdirectories and unsupported files are skipped; each document id
+        is the file stem, so two files sharing a stem raise ``ValueError``
+        before anything is ingested.
+    max_workers:
+        Number of worker processes. Defaults to ``os.cpu_count()``; a single
+        worker ingests the files in the current process.
+    **options:
+        Keyword arguments forwarded to :func:`ingest_document` for every file.
+
+    Returns
+    -------
+    list of Path
+        The chunks JSONL paths, in file name order.
+    """
+
+    if not input_dir.is_dir():
+        msg = f"Input directory not found: {input_dir}"
+        raise FileNotFoundError(msg)
+
+    paths = sorted(
+        path
+        for path in input_dir.iterdir()
+        if path.is_file() and path.suffix.lower() in _CLEANER_REGISTRY
+    )
+    # The stem keys the clean file, the chunks file and the database rows.
+    by_stem: Dict[str, Path] = {}
+    for path in paths:
+        other = by_stem.setdefault(path.stem, path)
+        if other is not path:
+            msg = f"Files {other.name} and {path.name} share the document id {path.stem!r}"
+            raise ValueError(msg)
+
+    workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        return [ingest_document(path, **options) for path in paths]
+
+    LOGGER.info("Ingesting %s files with %s processes", len(paths), workers)
+    worker = partial(ingest_document, **options)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_ingest_worker) as executor:
+        return list(executor.map(worker, paths))
+
+
 def parse_args() -> argparse.Namespace:
     """Parse CLI arguments for the ingestion script."""
 
     parser = argparse.ArgumentParser(
         description="Run the ingestion pipeline (clean + chunk)."
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "--input-file",
-        required=True,
         help="Path to the input document to ingest.",
     )
+    source.add_argument(
+        "--input-dir",
+        help="Directory whose supported documents should be ingested in parallel.",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        help="Worker processes used with --input-dir. Defaults to the CPU count.",
+    )
     parser.add_argument(
         "--document-id",
         help="Optional document identifier. Defaults to the input file stem.",
@@ -215,7 +361,18 @@ def parse_args() -> argparse.Namespace:
         default=16,
         help="Batch size used when calling the embedding loader.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--embedding-cache",
+        help="Optional SQLite file caching embeddings by content hash across runs.",
+    )
+    parser.add_argument(
+        "--clean-cache-dir",
+        help="Optional directory caching cleaned text by input content hash across runs.",
+    )
+    args = parser.parse_args()
+    if args.input_dir and (args.document_id or args.title or args.meta_file):
+        parser.error("--document-id, --title and --meta-file apply to a single --input-file only.")
+    return args
 
 
 def main() -> None:
@@ -224,27 +381,37 @@ def main() -> None:
     configure_logging()
     args = parse_args()
 
-    input_path = Path(args.input_file)
     document_id = args.document_id or None
     title = args.title or None
     meta_file = Path(args.meta_file) if args.meta_file else None
     clean_dir = Path(args.clean_output_dir)
     chunks_dir = Path(args.chunks_output_dir)
     llm_log_dir = Path(args.llm_log_dir) if args.llm_log_dir else None
+    embedding_cache_path = Path(args.embedding_cache) if args.embedding_cache else None
+    clean_cache_dir = Path(args.clean_cache_dir) if args.clean_cache_dir else None
+
+    options: Dict[str, Any] = {
+        "clean_output_dir": clean_dir,
+        "chunks_output_dir": chunks_dir,
+        "use_llm": not args.disable_llm,
+        "llm_log_dir": llm_log_dir,
+        "loader_dead_letter_dir": Path(args.dead_letter_dir),
+        "loader_batch_size": args.loader_batch_size,
+        "embedding_cache_path": embedding_cache_path,
+        "clean_cache_dir": clean_cache_dir,
+    }
 
     try:
-        ingest_document(
-            input_path,
-            document_id=document_id,
-            title=title,
-            meta_file=meta_file,
-            clean_output_dir=clean_dir,
-            chunks_output_dir=chunks_dir,
-            use_llm=not args.disable_llm,
-            llm_log_dir=llm_log_dir,
-            loader_dead_letter_dir=Path(args.dead_letter_dir),
-            loader_batch_size=args.loader_batch_size,
-        )
+        if args.input_dir:
+            ingest_directory(Path(args.input_dir), max_workers=args.max_workers, **options)
+        else:
+            ingest_document(
+                Path(args.input_file),
+                document_id=document_id,
+                title=title,
+                meta_file=meta_file,
+                **options,
+            )
     except FileNotFoundError:
         LOGGER.exception("Input or metadata file not found.")
         raise SystemExit(1) from None